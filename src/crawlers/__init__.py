@@ -28,6 +28,10 @@
     >>> policies = await crawler.crawl()
     >>>
     >>> # 스케줄러를 통한 자동 크롤링
+    >>> # (장시간 실행되는 진입점은 asyncio.run 전에 uvloop를 적용 권장)
+    >>> import uvloop
+    >>> uvloop.install()  # Windows 제외
+    >>>
     >>> scheduler = CrawlerScheduler()
     >>> scheduler.add_job('kinfa', cron='0 6 * * *')  # 매일 오전 6시
     >>> scheduler.start()
@@ -23,12 +23,63 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Dict, Any, Optional, Callable
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Callable, Tuple, Union
 import asyncio
 import aiohttp
+import hashlib
 import logging
+import soupsieve
 from bs4 import BeautifulSoup
 
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick 미설치 시 순차 탐색으로 대체
+    ahocorasick = None
+
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:  # lxml 미설치 시 순수 Python 파서로 대체
+    _HTML_PARSER = "html.parser"
+
+
+@lru_cache(maxsize=65536)
+def _url_hash(url: str) -> str:
+    """
+    정책 ID용 URL 해시 (재크롤링 시 같은 URL은 다시 계산하지 않음)
+
+    기존에 저장된 정책 ID와 호환되도록 MD5 앞 8자리를 유지합니다.
+
+    Args:
+        url: 정책 페이지 URL
+
+    Returns:
+        str: 16진수 8자리 해시
+    """
+    return hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()[:8]
+
+
+@lru_cache(maxsize=128)
+def _cached_automaton(items: Tuple[Tuple[str, Any], ...]) -> Any:
+    """
+    키워드 목록별 Aho-Corasick 오토마톤 (크롤러 인스턴스 간 공유)
+
+    팩토리가 작업마다 크롤러를 새로 만들어도 같은 키워드 목록이면
+    오토마톤을 다시 만들지 않습니다. 완성된 오토마톤은 읽기 전용입니다.
+
+    Args:
+        items: (키워드, 값) 튜플 목록 (순서가 우선순위)
+
+    Returns:
+        Any: 완성된 오토마톤
+    """
+    automaton = ahocorasick.Automaton()
+    for idx, (keyword, value) in enumerate(items):
+        automaton.add_word(keyword, (idx, value))
+    automaton.make_automaton()
+    return automaton
+
 
 # =============================================================================
 # 열거형 정의 (Enumerations)
@@ -82,6 +133,7 @@ class CrawlerConfig:
         user_agent (str): HTTP 요청에 사용할 User-Agent 헤더
         headers (Dict): 추가 HTTP 헤더
         proxy (Optional[str]): 프록시 서버 URL (필요시)
+        debug_raw_html (bool): PolicyData에 원본 HTML 일부를 보관할지 여부 (디버깅용)
 
     Example:
         >>> config = CrawlerConfig(
@@ -105,15 +157,17 @@ class CrawlerConfig:
     )
     headers: Dict[str, str] = field(default_factory=dict)
     proxy: Optional[str] = None
+    debug_raw_html: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyData:
     """
     단일 정책 데이터를 담는 데이터 클래스
 
     크롤링된 개별 정책 정보를 구조화하여 저장합니다.
     Vector DB에 삽입하기 전 중간 데이터 형태로 사용됩니다.
+    대량 크롤링 시 메모리를 줄이기 위해 인스턴스 __dict__ 없이 슬롯으로 저장합니다.
 
     Attributes:
         policy_id (str): 정책 고유 식별자
@@ -133,7 +187,7 @@ class PolicyData:
         income_limit (Optional[int]): 소득 제한 (원)
         location (List[str]): 지역 제한
         keywords (List[str]): 검색 키워드
-        raw_html (str): 원본 HTML (디버깅용)
+        raw_html (str): 원본 HTML (디버깅용, debug_raw_html 설정 시에만 저장)
         crawled_at (datetime): 크롤링 시각
     """
     policy_id: str
@@ -156,7 +210,12 @@ class PolicyData:
     raw_html: str = ""
     crawled_at: datetime = field(default_factory=datetime.now)
 
-    def to_vector_db_format(self, source_tier: SourceTier, source_url: str) -> Dict[str, Any]:
+    def to_vector_db_format(
+        self,
+        source_tier: SourceTier,
+        source_url: str,
+        publish_year: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Vector DB 삽입용 포맷으로 변환
 
@@ -166,6 +225,7 @@ class PolicyData:
         Args:
             source_tier: 데이터 소스의 신뢰도 등급
             source_url: 데이터를 수집한 원본 URL
+            publish_year: 게시 연도 (일괄 변환 시 한 번만 계산해 전달, 없으면 현재 연도)
 
         Returns:
             Dict[str, Any]: Vector DB 삽입용 딕셔너리
@@ -182,7 +242,7 @@ class PolicyData:
             "content": self.content,
             "metadata": {
                 "source_tier": source_tier.value,
-                "publish_year": datetime.now().year,
+                "publish_year": publish_year or datetime.now().year,
                 "policy_end_date": self.end_date or "N/A",
                 "policy_name": self.policy_name,
                 "policy_category": self.category,
@@ -217,6 +277,7 @@ class CrawlResult:
         completed_at (Optional[datetime]): 크롤링 완료 시각
         duration_seconds (float): 총 소요 시간 (초)
         source_name (str): 데이터 소스 이름
+        source_tier (SourceTier): 데이터 소스의 신뢰도 등급
         metadata (Dict): 추가 메타데이터
     """
     success: bool
@@ -228,6 +289,7 @@ class CrawlResult:
     completed_at: Optional[datetime] = None
     duration_seconds: float = 0.0
     source_name: str = ""
+    source_tier: SourceTier = SourceTier.TIER_2  # 출처를 모르면 참고용으로 취급
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     def add_policy(self, policy: PolicyData) -> None:
@@ -386,7 +448,8 @@ class BaseCrawler(ABC):
         # 결과 객체 초기화
         result = CrawlResult(
             success=False,
-            source_name=self._config.source_name
+            source_name=self._config.source_name,
+            source_tier=self._config.source_tier
         )
 
         try:
@@ -569,18 +632,21 @@ class BaseCrawler(ABC):
         """
         HTML 문자열을 BeautifulSoup 객체로 파싱 (protected)
 
+        C로 구현된 lxml 파서를 우선 사용하고, 설치되지 않은 경우
+        html.parser로 대체합니다.
+
         Args:
             html: HTML 문자열
 
         Returns:
             BeautifulSoup: 파싱된 HTML 객체
         """
-        return BeautifulSoup(html, 'html.parser')
+        return BeautifulSoup(html, _HTML_PARSER)
 
     def _extract_text(
         self,
         soup: BeautifulSoup,
-        selector: str,
+        selector: Union[str, soupsieve.SoupSieve],
         default: str = ""
     ) -> str:
         """
@@ -588,13 +654,16 @@ class BaseCrawler(ABC):
 
         Args:
             soup: BeautifulSoup 객체
-            selector: CSS 선택자
+            selector: CSS 선택자 (문자열 또는 soupsieve.compile()로 미리 컴파일된 선택자)
             default: 요소를 찾지 못했을 때 반환할 기본값
 
         Returns:
             str: 추출된 텍스트 (정규화됨)
         """
-        element = soup.select_one(selector)
+        if isinstance(selector, str):
+            element = soup.select_one(selector)
+        else:
+            element = selector.select_one(soup)
         if element:
             # 텍스트 정규화 (공백 정리)
             return ' '.join(element.get_text().split())
@@ -603,25 +672,47 @@ class BaseCrawler(ABC):
     def _extract_list(
         self,
         soup: BeautifulSoup,
-        selector: str
+        selector: Union[str, soupsieve.SoupSieve]
     ) -> List[str]:
         """
         CSS 선택자로 리스트 항목들 추출 (protected)
 
         Args:
             soup: BeautifulSoup 객체
-            selector: CSS 선택자
+            selector: CSS 선택자 (문자열 또는 soupsieve.compile()로 미리 컴파일된 선택자)
 
         Returns:
             List[str]: 추출된 텍스트 리스트
         """
-        elements = soup.select(selector)
+        if isinstance(selector, str):
+            elements = soup.select(selector)
+        else:
+            elements = selector.select(soup)
         return [
             ' '.join(el.get_text().split())
             for el in elements
             if el.get_text().strip()
         ]
 
+    def _build_automaton(self, keywords: Dict[str, Any]) -> Optional[Any]:
+        """
+        키워드 매핑으로 Aho-Corasick 오토마톤 생성 (protected)
+
+        여러 키워드를 텍스트 한 번의 순회로 찾기 위해 사용합니다.
+        각 키워드의 값은 (선언 순서, 매핑 값) 튜플로 저장되어
+        호출 측에서 선언 순서 기반 우선순위를 유지할 수 있습니다.
+
+        Args:
+            keywords: 키워드 -> 값 매핑 (삽입 순서가 우선순위)
+
+        Returns:
+            Optional[Any]: 오토마톤, pyahocorasick 미설치 시 None
+        """
+        if ahocorasick is None or not keywords:
+            return None
+
+        return _cached_automaton(tuple(keywords.items()))
+
     def _generate_policy_id(self, url: str) -> str:
         """
         정책 URL에서 고유 ID 생성 (protected)
@@ -632,9 +723,8 @@ class BaseCrawler(ABC):
         Returns:
             str: 정책 고유 ID
         """
-        import hashlib
         # URL 해시로 고유 ID 생성
-        url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+        url_hash = _url_hash(url)
         source_prefix = self._config.source_name[:4].lower()
         return f"{source_prefix}-{datetime.now().year}-{url_hash}"
 
@@ -17,13 +17,50 @@ Version: 1.0.0
 
 import re
 import json
+from itertools import islice
 from typing import List, Optional
 from datetime import datetime
 from urllib.parse import urljoin, urlencode
 
+import soupsieve
+
+try:
+    # 선형 시간 정규식 엔진 (ReDoS 방지, 미설치 시 표준 re 사용)
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
 from .base_crawler import BaseCrawler, CrawlerConfig, PolicyData, SourceTier
 
 
+# =============================================================================
+# 미리 컴파일된 CSS 선택자 (정책마다 선택자를 다시 파싱하지 않도록)
+# =============================================================================
+
+_SEL_LIST_ITEMS = soupsieve.compile(
+    ".policy-list-item, .welfare-list li, "
+    "tr[data-wlfare-info-id], .list-item[data-id]"
+)
+_SEL_ITEM_LINK = soupsieve.compile("a[href]")
+_SEL_TITLE = soupsieve.compile("h1.policy-title, .detail-title, .tit")
+_SEL_SUMMARY = soupsieve.compile(".policy-summary, .intro-text")
+_SEL_TARGET = soupsieve.compile(".support-target, [class*='대상']")
+_SEL_BENEFITS = soupsieve.compile(".support-content, [class*='지원내용']")
+# 서류 목록은 복합 선택자 하나로 DOM을 한 번만 순회
+_SEL_DOCUMENTS = soupsieve.compile(".document-list li, [class*='서류'] li")
+
+
+# =============================================================================
+# 미리 컴파일된 정규식 패턴 (추출기 호출마다 패턴 캐시를 조회하지 않도록)
+# =============================================================================
+
+_POLICY_ID_RE = _regex.compile(r'wlfareInfoId=(\w+)')
+# 연령 패턴 예시: "19~34세", "19 - 39세"
+_AGE_RANGE_RE = _regex.compile(r'(\d{1,2})\s*[~-]\s*(\d{1,2})\s*세')
+_INCOME_MEDIAN_RE = _regex.compile(r'중위소득\s*(\d+)\s*%')
+_DATE_RE = _regex.compile(r'(\d{4})[.\-년]\s*(\d{1,2})[.\-월]\s*(\d{1,2})')
+
+
 class BokjiroCrawler(BaseCrawler):
     """
     복지로 정책 크롤러
@@ -56,10 +93,21 @@ class BokjiroCrawler(BaseCrawler):
             "교육": "교육", "건강": "건강", "창업": "창업"
         }
         self._youth_keywords = ["청년", "청소년", "대학생", "취준생", "사회초년생"]
+        self._common_documents = ["신분증", "주민등록등본", "소득증명서", "재직증명서"]
+
+        # 키워드 목록별 Aho-Corasick 오토마톤 (미설치 시 None)
+        self._category_automaton = self._build_automaton(self._category_mapping)
+        self._youth_automaton = self._build_automaton(
+            {kw: kw for kw in self._youth_keywords}
+        )
+        self._document_automaton = self._build_automaton(
+            {doc: doc for doc in self._common_documents}
+        )
 
     async def fetch_policy_list(self) -> List[str]:
         """정책 목록 URL 수집"""
-        policy_urls = []
+        seen = set()
+        policy_urls: List[str] = []
         current_page = 1
 
         while current_page <= self._config.max_pages:
@@ -75,10 +123,7 @@ class BokjiroCrawler(BaseCrawler):
                     break
 
                 soup = self._parse_html(html)
-                items = soup.select(
-                    ".policy-list-item, .welfare-list li, "
-                    "tr[data-wlfare-info-id], .list-item[data-id]"
-                )
+                items = _SEL_LIST_ITEMS.select(soup)
 
                 if not items:
                     items = self._extract_from_json(html)
@@ -94,7 +139,8 @@ class BokjiroCrawler(BaseCrawler):
                             item.get_text() if hasattr(item, 'get_text')
                             else str(item)
                         )
-                        if self._is_youth_policy(item_text):
+                        if self._is_youth_policy(item_text) and detail_url not in seen:
+                            seen.add(detail_url)
                             policy_urls.append(detail_url)
 
                 current_page += 1
@@ -103,34 +149,34 @@ class BokjiroCrawler(BaseCrawler):
                 self._logger.error(f"목록 페이지 처리 오류: {e}")
                 break
 
-        return list(set(policy_urls))
+        return policy_urls
 
     async def parse_policy(self, html: str, url: str) -> Optional[PolicyData]:
         """정책 데이터 파싱"""
         try:
             soup = self._parse_html(html)
 
-            policy_name = self._extract_text(
-                soup, "h1.policy-title, .detail-title, .tit", "제목 없음"
-            )
-            summary = self._extract_text(soup, ".policy-summary, .intro-text")
+            policy_name = self._extract_text(soup, _SEL_TITLE, "제목 없음")
+            summary = self._extract_text(soup, _SEL_SUMMARY)
 
             content_parts = [f"정책명: {policy_name}"]
             if summary:
                 content_parts.append(f"요약: {summary}")
 
-            target = self._extract_text(soup, ".support-target, [class*='대상']")
-            benefits = self._extract_text(soup, ".support-content, [class*='지원내용']")
+            target = self._extract_text(soup, _SEL_TARGET)
+            benefits = self._extract_text(soup, _SEL_BENEFITS)
 
             if target:
                 content_parts.append(f"지원대상: {target}")
             if benefits:
                 content_parts.append(f"지원내용: {benefits}")
 
-            age_min, age_max = self._extract_age_range(target + soup.get_text())
+            # 페이지 전체 텍스트는 한 번만 추출하여 추출기들이 공유
+            page_text = soup.get_text()
+            age_min, age_max = self._extract_age_range(target + page_text)
             income_limit = self._extract_income_limit(target)
-            required_documents = self._extract_documents(soup)
-            start_date, end_date = self._extract_dates(soup)
+            required_documents = self._extract_documents(soup, page_text)
+            start_date, end_date = self._extract_dates(soup, page_text)
             category = self._determine_category(policy_name + summary)
 
             return PolicyData(
@@ -151,7 +197,7 @@ class BokjiroCrawler(BaseCrawler):
                 income_limit=income_limit,
                 location=["전국"],
                 keywords=["청년", "복지", category],
-                raw_html=html[:3000],
+                raw_html=html[:3000] if self._config.debug_raw_html else "",
                 crawled_at=datetime.now()
             )
         except Exception as e:
@@ -164,9 +210,9 @@ class BokjiroCrawler(BaseCrawler):
             policy_id = item.get('data-wlfare-info-id') or item.get('data-id')
             if policy_id:
                 return policy_id
-            link = item.select_one('a[href]')
+            link = _SEL_ITEM_LINK.select_one(item)
             if link:
-                match = re.search(r'wlfareInfoId=(\w+)', link.get('href', ''))
+                match = _POLICY_ID_RE.search(link.get('href', ''))
                 if match:
                     return match.group(1)
         elif isinstance(item, dict):
@@ -188,10 +234,17 @@ class BokjiroCrawler(BaseCrawler):
 
     def _is_youth_policy(self, text: str) -> bool:
         """청년 정책 여부 확인"""
-        return any(kw in text.lower() for kw in self._youth_keywords)
+        text = text.lower()
+        if self._youth_automaton is not None:
+            return next(self._youth_automaton.iter(text), None) is not None
+        return any(kw in text for kw in self._youth_keywords)
 
     def _determine_category(self, text: str) -> str:
         """카테고리 결정"""
+        if self._category_automaton is not None:
+            # 선언 순서가 가장 앞선 키워드의 카테고리 선택
+            hits = [hit for _, hit in self._category_automaton.iter(text)]
+            return min(hits)[1] if hits else "생활지원"
         for kw, cat in self._category_mapping.items():
             if kw in text:
                 return cat
@@ -199,36 +252,47 @@ class BokjiroCrawler(BaseCrawler):
 
     def _extract_age_range(self, text: str) -> tuple:
         """연령 범위 추출"""
-        match = re.search(r'(\d{1,2})\s*[~-]\s*(\d{1,2})\s*세', text)
+        # 패턴에 '세'가 필요하므로 없으면 정규식 탐색 생략
+        match = _AGE_RANGE_RE.search(text) if "세" in text else None
         if match:
             return int(match.group(1)), int(match.group(2))
         return 19, 34
 
     def _extract_income_limit(self, text: str) -> Optional[int]:
         """소득 제한 추출"""
-        match = re.search(r'중위소득\s*(\d+)\s*%', text)
+        if "중위소득" not in text:
+            return None
+        match = _INCOME_MEDIAN_RE.search(text)
         if match:
             return int(match.group(1)) * 500000
         return None
 
-    def _extract_documents(self, soup) -> List[str]:
-        """필수 서류 추출"""
-        items = soup.select(".document-list li, [class*='서류'] li")
+    def _extract_documents(self, soup, text: Optional[str] = None) -> List[str]:
+        """필수 서류 추출 (text: 미리 추출한 페이지 텍스트)"""
+        items = _SEL_DOCUMENTS.select(soup)
         if items:
-            return [i.get_text().strip() for i in items if i.get_text().strip()][:10]
-        text = soup.get_text()
-        docs = ["신분증", "주민등록등본", "소득증명서", "재직증명서"]
-        return [d for d in docs if d in text]
-
-    def _extract_dates(self, soup) -> tuple:
-        """신청 기간 추출"""
-        dates = re.findall(r'(\d{4})[.\-년](\d{1,2})[.\-월](\d{1,2})', soup.get_text())
+            texts = (i.get_text(" ", strip=True) for i in items)
+            # 순서를 유지하며 중복 제거 (최대 10개)
+            return list(islice(dict.fromkeys(t for t in texts if t), 10))
+        if text is None:
+            text = soup.get_text()
+        if self._document_automaton is not None:
+            found = {doc for _, (_, doc) in self._document_automaton.iter(text)}
+            return [d for d in self._common_documents if d in found]
+        return [d for d in self._common_documents if d in text]
+
+    def _extract_dates(self, soup, text: Optional[str] = None) -> tuple:
+        """신청 기간 추출 (text: 미리 추출한 페이지 텍스트)"""
+        if text is None:
+            text = soup.get_text()
+        dates = _DATE_RE.findall(text)
         if dates:
-            d = dates[0]
-            start = f"{d[0]}-{int(d[1]):02d}-{int(d[2]):02d}"
+            # 정규식 그룹은 이미 문자열이므로 int 변환 없이 zfill로 자릿수 맞춤
+            y, m, d = dates[0]
+            start = f"{y}-{m.zfill(2)}-{d.zfill(2)}"
             end = None
             if len(dates) > 1:
-                d = dates[1]
-                end = f"{d[0]}-{int(d[1]):02d}-{int(d[2]):02d}"
+                y, m, d = dates[1]
+                end = f"{y}-{m.zfill(2)}-{d.zfill(2)}"
             return start, end
         return None, None
@@ -16,10 +16,20 @@ Version: 1.0.0
 """
 
 import re
+from functools import lru_cache
+from itertools import islice
 from typing import List, Optional
 from datetime import datetime
 from urllib.parse import urljoin
 
+import soupsieve
+
+try:
+    # 선형 시간 정규식 엔진 (ReDoS 방지, 미설치 시 표준 re 사용)
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
 from .base_crawler import (
     BaseCrawler,
     CrawlerConfig,
@@ -28,6 +38,63 @@ from .base_crawler import (
 )
 
 
+# =============================================================================
+# 미리 컴파일된 CSS 선택자 (정책마다 선택자를 다시 파싱하지 않도록)
+# =============================================================================
+
+_SEL_POLICY_LINKS = soupsieve.compile("a.policy-link, .board-list a[href*='view']")
+_SEL_TITLE = soupsieve.compile("h1.policy-title, .view-title, .board-view h2")
+_SEL_SUMMARY = soupsieve.compile(".policy-summary, .view-summary, .intro")
+_SEL_DETAIL = soupsieve.compile(".policy-content, .view-content, .board-content")
+_SEL_ELIGIBILITY = soupsieve.compile(".eligibility, .target-info, [class*='자격']")
+_SEL_BENEFITS = soupsieve.compile(".benefits, .support-content, [class*='지원']")
+_SEL_DOCUMENTS = soupsieve.compile(
+    ".documents li, .required-docs li, "
+    "[class*='서류'] li, .doc-list li"
+)
+
+
+# =============================================================================
+# 미리 컴파일된 정규식 패턴 (추출기 호출마다 패턴 캐시를 조회하지 않도록)
+# =============================================================================
+
+# 연령 패턴 예시: "만 19세 ~ 34세", "19~34세", "만 34세 이하"
+# (텍스트 어디에 있든 범위 패턴이 상한 패턴보다 우선)
+_AGE_RANGE_RE = _regex.compile(
+    r'만?\s*(\d{1,2})\s*세?\s*[~-]\s*(\d{1,2})\s*세'
+)
+_AGE_MAX_RE = _regex.compile(r'만\s*(\d{1,2})\s*세\s*이하')
+
+# 소득 패턴 예시: "연소득 5,000만원", "연 5천만원"
+_INCOME_PATTERNS = (
+    _regex.compile(r'연\s*소득\s*(\d{1,2}),?(\d{3})\s*만\s*원'),
+    _regex.compile(r'(\d{1,2})\s*천\s*만\s*원'),
+    _regex.compile(r'소득\s*(\d{1,2}),?(\d{3})\s*만'),
+)
+
+# 날짜 패턴: "2025.01.01", "2025-01-01", "2025년 1월 1일"
+_DATE_RE = _regex.compile(r'(\d{4})[.\-년]\s*(\d{1,2})[.\-월]\s*(\d{1,2})')
+
+
+@lru_cache(maxsize=4096)
+def _iso_date(year: str, month: str, day: str) -> Optional[str]:
+    """
+    날짜 문자열 조각을 ISO 형식으로 변환 (공고 시작일처럼 반복되는 날짜는 캐시)
+
+    Args:
+        year: 연도 문자열
+        month: 월 문자열
+        day: 일 문자열
+
+    Returns:
+        Optional[str]: "YYYY-MM-DD" 형식 날짜, 존재하지 않는 날짜면 None
+    """
+    try:
+        return datetime(int(year), int(month), int(day)).date().isoformat()
+    except ValueError:
+        return None
+
+
 class KinfaCrawler(BaseCrawler):
     """
     서민금융진흥원 정책 크롤러
@@ -88,6 +155,31 @@ class KinfaCrawler(BaseCrawler):
             "보험": "금융상품",
             "보증": "금융상품"
         }
+        self._category_automaton = self._build_automaton(self._category_mapping)
+
+        # 검색 키워드로 추가할 주요 단어
+        self._important_words = ["대출", "저축", "계좌", "대환", "저금리", "지원금"]
+        self._keyword_automaton = self._build_automaton(
+            {word: word for word in self._important_words}
+        )
+
+        # 청년 정책 판별 키워드
+        self._youth_keywords = [
+            "청년", "youth", "대학생", "사회초년생",
+            "취준생", "19세", "34세", "39세"
+        ]
+        self._youth_automaton = self._build_automaton(
+            {keyword: keyword for keyword in self._youth_keywords}
+        )
+
+        # 서류 목록이 없을 때 본문에서 찾을 공통 서류
+        self._common_documents = [
+            "신분증", "주민등록등본", "소득증명", "재직증명서",
+            "원천징수영수증", "사업자등록증", "통장사본"
+        ]
+        self._document_automaton = self._build_automaton(
+            {doc: doc for doc in self._common_documents}
+        )
 
     # =========================================================================
     # 추상 메서드 구현
@@ -103,7 +195,9 @@ class KinfaCrawler(BaseCrawler):
         Returns:
             List[str]: 정책 상세 페이지 URL 목록
         """
-        policy_urls = []
+        # 발견 순서를 유지하며 중복 제거
+        seen = set()
+        policy_urls: List[str] = []
         current_page = 1
 
         while current_page <= self._config.max_pages:
@@ -122,7 +216,7 @@ class KinfaCrawler(BaseCrawler):
 
             # 정책 링크 추출 (사이트 구조에 맞게 수정 필요)
             # 예시: <a class="policy-link" href="/policy/view/123">
-            links = soup.select("a.policy-link, .board-list a[href*='view']")
+            links = _SEL_POLICY_LINKS.select(soup)
 
             if not links:
                 # 더 이상 정책이 없으면 종료
@@ -137,15 +231,15 @@ class KinfaCrawler(BaseCrawler):
                     full_url = urljoin(self._config.base_url, href)
 
                     # 청년 관련 정책만 필터링
-                    link_text = link.get_text().lower()
-                    if self._is_youth_policy(link_text):
+                    # 소문자 변환은 _is_youth_policy에서 한 번만 수행
+                    link_text = link.get_text()
+                    if self._is_youth_policy(link_text) and full_url not in seen:
+                        seen.add(full_url)
                         policy_urls.append(full_url)
                         self._logger.debug(f"정책 발견: {full_url}")
 
             current_page += 1
 
-        # 중복 제거
-        policy_urls = list(set(policy_urls))
         self._logger.info(f"총 {len(policy_urls)}개의 청년 정책 URL 수집 완료")
 
         return policy_urls
@@ -176,28 +270,18 @@ class KinfaCrawler(BaseCrawler):
             # =================================================================
 
             # 정책명 추출
-            policy_name = self._extract_text(
-                soup,
-                "h1.policy-title, .view-title, .board-view h2",
-                "제목 없음"
-            )
+            policy_name = self._extract_text(soup, _SEL_TITLE, "제목 없음")
 
             # 정책 내용 추출 (임베딩 대상)
             content_parts = []
 
             # 요약/개요
-            summary = self._extract_text(
-                soup,
-                ".policy-summary, .view-summary, .intro"
-            )
+            summary = self._extract_text(soup, _SEL_SUMMARY)
             if summary:
                 content_parts.append(f"개요: {summary}")
 
             # 상세 내용
-            detail_content = self._extract_text(
-                soup,
-                ".policy-content, .view-content, .board-content"
-            )
+            detail_content = self._extract_text(soup, _SEL_DETAIL)
             if detail_content:
                 content_parts.append(detail_content)
 
@@ -205,25 +289,23 @@ class KinfaCrawler(BaseCrawler):
             # 자격 조건 추출
             # =================================================================
 
-            eligibility = self._extract_text(
-                soup,
-                ".eligibility, .target-info, [class*='자격']"
-            )
+            eligibility = self._extract_text(soup, _SEL_ELIGIBILITY)
+
+            # 추출기 입력 텍스트는 한 번만 조합하여 재사용
+            condition_text = f"{eligibility}\n{detail_content}"
+            title_text = f"{policy_name} {summary}"
 
             # 연령 조건 추출
-            age_min, age_max = self._extract_age_range(eligibility + detail_content)
+            age_min, age_max = self._extract_age_range(condition_text)
 
             # 소득 조건 추출
-            income_limit = self._extract_income_limit(eligibility + detail_content)
+            income_limit = self._extract_income_limit(condition_text)
 
             # =================================================================
             # 지원 내용 추출
             # =================================================================
 
-            benefits = self._extract_text(
-                soup,
-                ".benefits, .support-content, [class*='지원']"
-            )
+            benefits = self._extract_text(soup, _SEL_BENEFITS)
             if benefits:
                 content_parts.append(f"지원내용: {benefits}")
 
@@ -231,19 +313,21 @@ class KinfaCrawler(BaseCrawler):
             # 필수 서류 추출
             # =================================================================
 
-            required_documents = self._extract_documents(soup)
+            # 페이지 전체 텍스트는 한 번만 추출하여 서류/기간 추출기가 공유
+            page_text = soup.get_text()
+            required_documents = self._extract_documents(soup, page_text)
 
             # =================================================================
             # 신청 기간 추출
             # =================================================================
 
-            start_date, end_date = self._extract_dates(soup)
+            start_date, end_date = self._extract_dates(soup, page_text)
 
             # =================================================================
             # 카테고리 결정
             # =================================================================
 
-            category = self._determine_category(policy_name + summary)
+            category = self._determine_category(title_text)
 
             # =================================================================
             # 전체 콘텐츠 조합
@@ -280,8 +364,9 @@ class KinfaCrawler(BaseCrawler):
                 target_age_max=age_max,
                 income_limit=income_limit,
                 location=["전국"],  # 서민금융진흥원은 전국 대상
-                keywords=self._extract_keywords(policy_name, summary),
-                raw_html=html[:5000],  # 디버깅용 (처음 5000자만)
+                keywords=self._extract_keywords(policy_name, title_text),
+                # 디버깅 설정 시에만 원본 HTML 보관 (처음 5000자만)
+                raw_html=html[:5000] if self._config.debug_raw_html else "",
                 crawled_at=datetime.now()
             )
 
@@ -306,12 +391,13 @@ class KinfaCrawler(BaseCrawler):
         Returns:
             bool: 청년 정책 여부
         """
-        youth_keywords = [
-            "청년", "youth", "대학생", "사회초년생",
-            "취준생", "19세", "34세", "39세"
-        ]
         text_lower = text.lower()
-        return any(keyword in text_lower for keyword in youth_keywords)
+
+        if self._youth_automaton is not None:
+            # 한 번의 순회로 탐색하고 첫 일치에서 종료
+            return next(self._youth_automaton.iter(text_lower), None) is not None
+
+        return any(keyword in text_lower for keyword in self._youth_keywords)
 
     def _determine_category(self, text: str) -> str:
         """
@@ -323,6 +409,13 @@ class KinfaCrawler(BaseCrawler):
         Returns:
             str: 정책 카테고리
         """
+        if self._category_automaton is not None:
+            # 한 번의 순회로 모든 키워드를 찾고, 선언 순서가 가장 앞선 것을 선택
+            hits = [hit for _, hit in self._category_automaton.iter(text)]
+            if hits:
+                return min(hits)[1]
+            return "금융상품"  # 기본값
+
         for keyword, category in self._category_mapping.items():
             if keyword in text:
                 return category
@@ -338,21 +431,15 @@ class KinfaCrawler(BaseCrawler):
         Returns:
             tuple: (최소 연령, 최대 연령)
         """
-        # 패턴 예시: "만 19세 ~ 34세", "19~34세"
-        patterns = [
-            r'만?\s*(\d{1,2})\s*세?\s*[~-]\s*(\d{1,2})\s*세',
-            r'(\d{1,2})\s*[~-]\s*(\d{1,2})\s*세',
-            r'만\s*(\d{1,2})\s*세\s*이하',
-        ]
+        # 모든 연령 패턴에 '세'가 필요하므로 없으면 정규식 탐색 생략
+        if "세" in text:
+            match = _AGE_RANGE_RE.search(text)
+            if match:
+                return int(match.group(1)), int(match.group(2))
 
-        for pattern in patterns:
-            match = re.search(pattern, text)
+            match = _AGE_MAX_RE.search(text)
             if match:
-                groups = match.groups()
-                if len(groups) == 2:
-                    return int(groups[0]), int(groups[1])
-                elif len(groups) == 1:
-                    return 19, int(groups[0])  # 기본 최소 19세
+                return 19, int(match.group(1))  # 기본 최소 19세
 
         # 기본값 (청년 기준)
         return 19, 34
@@ -367,15 +454,12 @@ class KinfaCrawler(BaseCrawler):
         Returns:
             Optional[int]: 소득 제한 (원 단위)
         """
-        # 패턴 예시: "연소득 5,000만원", "연 5천만원"
-        patterns = [
-            r'연\s*소득\s*(\d{1,2}),?(\d{3})\s*만\s*원',
-            r'(\d{1,2})\s*천\s*만\s*원',
-            r'소득\s*(\d{1,2}),?(\d{3})\s*만',
-        ]
+        # 모든 소득 패턴에 '만'이 필요하므로 없으면 정규식 탐색 생략
+        if "만" not in text:
+            return None
 
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _INCOME_PATTERNS:
+            match = pattern.search(text)
             if match:
                 groups = match.groups()
                 if len(groups) == 2:
@@ -388,12 +472,13 @@ class KinfaCrawler(BaseCrawler):
 
         return None
 
-    def _extract_documents(self, soup) -> List[str]:
+    def _extract_documents(self, soup, text: Optional[str] = None) -> List[str]:
         """
         필수 서류 목록 추출
 
         Args:
             soup: BeautifulSoup 객체
+            text: 미리 추출한 페이지 텍스트 (없으면 soup에서 추출)
 
         Returns:
             List[str]: 필수 서류 목록
@@ -402,70 +487,78 @@ class KinfaCrawler(BaseCrawler):
         documents = []
 
         # 리스트 형태로 된 서류 목록
-        doc_lists = soup.select(
-            ".documents li, .required-docs li, "
-            "[class*='서류'] li, .doc-list li"
-        )
+        doc_lists = _SEL_DOCUMENTS.select(soup)
 
         if doc_lists:
+            # 항목당 한 번만 텍스트를 추출 (strip=True로 조각별 공백 정리)
             documents = [
-                li.get_text().strip()
-                for li in doc_lists
-                if li.get_text().strip()
+                text
+                for text in (li.get_text(" ", strip=True) for li in doc_lists)
+                if text
             ]
         else:
             # 텍스트에서 서류 추출
-            text = soup.get_text()
-            common_docs = [
-                "신분증", "주민등록등본", "소득증명", "재직증명서",
-                "원천징수영수증", "사업자등록증", "통장사본"
-            ]
-            documents = [doc for doc in common_docs if doc in text]
+            if text is None:
+                text = soup.get_text()
 
-        return documents[:10]  # 최대 10개
+            if self._document_automaton is not None:
+                # 한 번의 순회로 모든 서류명을 찾고 선언 순서대로 정렬
+                found = {doc for _, (_, doc) in self._document_automaton.iter(text)}
+                documents = [doc for doc in self._common_documents if doc in found]
+            else:
+                documents = [doc for doc in self._common_documents if doc in text]
 
-    def _extract_dates(self, soup) -> tuple:
+        # 순서를 유지하며 중복 제거 (최대 10개)
+        return list(islice(dict.fromkeys(documents), 10))
+
+    def _extract_dates(self, soup, text: Optional[str] = None) -> tuple:
         """
         신청 기간 추출
 
         Args:
             soup: BeautifulSoup 객체
+            text: 미리 추출한 페이지 텍스트 (없으면 soup에서 추출)
 
         Returns:
             tuple: (시작일, 종료일)
         """
-        # 날짜 패턴: "2025.01.01", "2025-01-01", "2025년 1월 1일"
-        date_pattern = r'(\d{4})[.\-년]\s*(\d{1,2})[.\-월]\s*(\d{1,2})'
+        if text is None:
+            text = soup.get_text()
 
-        text = soup.get_text()
-        dates = re.findall(date_pattern, text)
+        # 앞에서부터 유효한 날짜 두 개만 변환 (전체 목록을 만들지 않음)
+        valid_dates = filter(None, map(self._to_iso_date, _DATE_RE.finditer(text)))
+        dates = list(islice(valid_dates, 2))
 
-        start_date = None
-        end_date = None
+        # 첫 번째 날짜를 시작일로, 두 번째 날짜를 종료일로
+        start_date = dates[0] if dates else None
+        end_date = dates[1] if len(dates) > 1 else None
 
-        if dates:
-            # 첫 번째 날짜를 시작일로
-            d = dates[0]
-            start_date = f"{d[0]}-{int(d[1]):02d}-{int(d[2]):02d}"
+        return start_date, end_date
 
-            # 두 번째 날짜를 종료일로
-            if len(dates) > 1:
-                d = dates[1]
-                end_date = f"{d[0]}-{int(d[1]):02d}-{int(d[2]):02d}"
+    @staticmethod
+    def _to_iso_date(match: re.Match) -> Optional[str]:
+        """
+        날짜 정규식 매치를 ISO 형식 문자열로 변환
 
-        return start_date, end_date
+        Args:
+            match: _DATE_RE 매치 객체
+
+        Returns:
+            Optional[str]: "YYYY-MM-DD" 형식 날짜, 존재하지 않는 날짜면 None
+        """
+        return _iso_date(*match.groups())
 
     def _extract_keywords(
         self,
         policy_name: str,
-        summary: str
+        title_text: str
     ) -> List[str]:
         """
         검색 키워드 추출
 
         Args:
             policy_name: 정책명
-            summary: 정책 요약
+            title_text: 정책명과 요약을 합친 텍스트
 
         Returns:
             List[str]: 키워드 목록
@@ -481,9 +574,14 @@ class KinfaCrawler(BaseCrawler):
         keywords.extend(name_keywords[:3])
 
         # 주요 키워드 추가
-        text = policy_name + " " + summary
-        important_words = ["대출", "저축", "계좌", "대환", "저금리", "지원금"]
-        keywords.extend([w for w in important_words if w in text])
+        if self._keyword_automaton is not None:
+            # 한 번의 순회로 모든 주요 단어를 찾고 선언 순서대로 추가
+            found = {hit for _, hit in self._keyword_automaton.iter(title_text)}
+            keywords.extend(word for _, word in sorted(found))
+        else:
+            keywords.extend(
+                [w for w in self._important_words if w in title_text]
+            )
 
-        # 중복 제거 및 반환
-        return list(set(keywords))[:10]
+        # 중복 제거 (순서 유지) 및 반환
+        return list(islice(dict.fromkeys(keywords), 10))
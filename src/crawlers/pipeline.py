@@ -6,7 +6,8 @@
 =============================================================================
 
 크롤링된 데이터를 처리하고 Vector DB에 저장하는 파이프라인입니다.
-Chain of Responsibility 패턴을 사용하여 처리 단계를 모듈화합니다.
+처리 단계를 모듈화하고, 단계 사이를 제한된 큐로 연결하여
+정제, 임베딩, 업서트를 동시에 진행합니다.
 
 Author: Youth Policy System Team
 Version: 1.0.0
@@ -14,14 +15,120 @@ Version: 1.0.0
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from collections import defaultdict
+from pathlib import Path
+from typing import List, Dict, Any, Callable, Optional, Tuple
 from dataclasses import dataclass
+from datetime import datetime
+import hashlib
 import logging
 import asyncio
+import re
+import sqlite3
+
+import numpy as np
 
 from .base_crawler import CrawlResult, PolicyData, SourceTier
 
 
+# 임베딩 입력 최대 문자 수 (토큰 제한)
+_MAX_EMBEDDING_CHARS = 8000
+
+# 임베딩 요청 하나의 토큰 예산 (API 한도 300k 토큰에 여유를 둠)
+_MAX_BATCH_TOKENS = 250_000
+
+# 텍스트 정규화 패턴 (모듈 로드 시 한 번만 컴파일)
+_ENTITY_RE = re.compile(r'&(nbsp|amp|lt|gt);')
+_ENTITY_MAP = {'nbsp': ' ', 'amp': '&', 'lt': '<', 'gt': '>'}
+_TOKEN_RE = re.compile(r'\w+')
+
+# 스트리밍 모드에서 단계 입력의 끝을 알리는 표식
+_END = object()
+
+# SQLite 바인딩 변수 한도(999) 안에서 IN 조회할 키 수
+_SQLITE_IN_CHUNK = 900
+
+# 임베딩 캐시 스키마 버전 (PRAGMA user_version에 기록)
+_CACHE_SCHEMA_VERSION = 1
+
+# SimHash 지문 비트 수와 근사 조회용 블록 분할 (16비트 블록 4개)
+_SIMHASH_BITS = 64
+_SIMHASH_BLOCKS = 4
+_SIMHASH_BLOCK_BITS = _SIMHASH_BITS // _SIMHASH_BLOCKS
+
+# 블록별 후보 조회 (각 분기가 커버링 인덱스만 읽도록 OR 대신 UNION ALL 사용)
+_SIMHASH_CANDIDATES_SQL = " UNION ALL ".join(
+    f"SELECT key, simhash FROM fingerprints WHERE namespace = ?1 AND b{i} = ?{i + 2}"
+    for i in range(_SIMHASH_BLOCKS)
+)
+
+
+def _simhash(text: str) -> int:
+    """
+    텍스트의 64비트 SimHash 지문 계산
+
+    문장부호를 제외한 소문자 토큰 3-gram을 각각 64비트로 해시하고,
+    비트 위치별 다수결로 지문을 만듭니다. 공백, 문장부호나 일부 단어만
+    다른 텍스트는 지문의 해밍 거리가 작습니다.
+
+    Args:
+        text: 대상 텍스트
+
+    Returns:
+        int: 64비트 지문
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    shingles = [
+        " ".join(tokens[i:i + 3]) for i in range(max(1, len(tokens) - 2))
+    ]
+    digests = b"".join(
+        hashlib.blake2b(shingle.encode(), digest_size=8).digest()
+        for shingle in shingles
+    )
+    bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8)).reshape(-1, 64)
+    fingerprint = bits.sum(axis=0) * 2 > len(shingles)
+    return int.from_bytes(np.packbits(fingerprint).tobytes(), "big")
+
+
+def _simhash_blocks(fingerprint: int) -> List[int]:
+    """지문을 16비트 블록으로 분할 (해밍 거리 3 이하면 한 블록 이상 일치)"""
+    mask = (1 << _SIMHASH_BLOCK_BITS) - 1
+    return [
+        (fingerprint >> (i * _SIMHASH_BLOCK_BITS)) & mask
+        for i in range(_SIMHASH_BLOCKS)
+    ]
+
+
+async def _drain(queue: asyncio.Queue) -> None:
+    """종료 표식이 나올 때까지 큐를 비움 (상위 단계가 막히지 않도록)"""
+    while await queue.get() is not _END:
+        pass
+
+
+async def _forward(context: 'PipelineContext', queue: asyncio.Queue) -> None:
+    """
+    컨텍스트의 처리 결과를 다음 단계의 입력 형태로 전달
+
+    임베딩이 있으면 (정책, 임베딩) 쌍, 정제된 정책이 있으면 정책,
+    그 외에는 원본 PolicyData를 전달합니다.
+
+    Args:
+        context: 파이프라인 컨텍스트
+        queue: 다음 단계의 입력 큐
+    """
+    if context.embeddings:
+        for policy in context.processed_policies:
+            embedding = context.embeddings.get(policy["id"])
+            if embedding is not None:
+                await queue.put((policy, embedding))
+    elif context.processed_policies:
+        for policy in context.processed_policies:
+            await queue.put(policy)
+    else:
+        for policy in context.crawl_result.policies:
+            await queue.put(policy)
+
+
 @dataclass
 class PipelineContext:
     """
@@ -32,13 +139,13 @@ class PipelineContext:
     Attributes:
         crawl_result (CrawlResult): 원본 크롤링 결과
         processed_policies (List): 처리된 정책 데이터
-        embeddings (Dict): 생성된 임베딩
+        embeddings (Dict): 생성된 임베딩 (float32 배열)
         errors (List): 처리 중 발생한 오류
         metadata (Dict): 추가 메타데이터
     """
     crawl_result: CrawlResult
     processed_policies: List[Dict[str, Any]] = None
-    embeddings: Dict[str, List[float]] = None
+    embeddings: Dict[str, np.ndarray] = None
     errors: List[str] = None
     metadata: Dict[str, Any] = None
 
@@ -58,55 +165,49 @@ class PipelineStep(ABC):
     """
     파이프라인 단계 추상 클래스
 
-    Chain of Responsibility 패턴의 핸들러 역할을 합니다.
-    각 단계는 데이터를 처리하고 다음 단계로 전달합니다.
+    각 단계는 입력 큐의 데이터를 처리하여 다음 단계의 입력 큐로 전달합니다.
+
+    process_stream을 재정의한 단계는 큐로 들어오는 항목을 하나씩 처리하고,
+    그렇지 않은 단계는 입력이 모두 도착한 뒤 process로 한 번에 처리합니다.
     """
 
     def __init__(self):
         """단계 초기화"""
-        self._next_step: Optional['PipelineStep'] = None
         self._logger = logging.getLogger(
             f"{__name__}.{self.__class__.__name__}"
         )
 
-    def set_next(self, step: 'PipelineStep') -> 'PipelineStep':
-        """
-        다음 단계 설정 (체이닝 지원)
-
-        Args:
-            step: 다음 단계
+    async def close(self) -> None:
+        """단계가 보유한 리소스 정리 (필요한 하위 클래스에서 재정의)"""
+        pass
 
-        Returns:
-            PipelineStep: 설정된 다음 단계 (체이닝용)
+    async def stream(
+        self,
+        context: PipelineContext,
+        in_queue: asyncio.Queue,
+        out_queue: asyncio.Queue
+    ) -> None:
         """
-        self._next_step = step
-        return step
+        스트리밍 모드 단계 실행
 
-    async def handle(self, context: PipelineContext) -> PipelineContext:
-        """
-        단계 실행 및 다음 단계 전달
+        입력 큐의 항목을 처리하여 출력 큐로 전달하고,
+        처리가 끝나면 출력 큐에 종료 표식을 넣습니다.
 
         Args:
             context: 파이프라인 컨텍스트
-
-        Returns:
-            PipelineContext: 처리된 컨텍스트
+            in_queue: 이전 단계의 출력 큐
+            out_queue: 다음 단계의 입력 큐
         """
         try:
-            # 현재 단계 처리
-            context = await self.process(context)
+            await self.process_stream(context, in_queue, out_queue)
             self._logger.debug(f"{self.__class__.__name__} 완료")
-
-            # 다음 단계로 전달
-            if self._next_step:
-                return await self._next_step.handle(context)
-
         except Exception as e:
             error_msg = f"{self.__class__.__name__} 오류: {str(e)}"
             context.errors.append(error_msg)
             self._logger.error(error_msg)
+            raise
 
-        return context
+        await out_queue.put(_END)
 
     @abstractmethod
     async def process(self, context: PipelineContext) -> PipelineContext:
@@ -121,6 +222,28 @@ class PipelineStep(ABC):
         """
         pass
 
+    async def process_stream(
+        self,
+        context: PipelineContext,
+        in_queue: asyncio.Queue,
+        out_queue: asyncio.Queue
+    ) -> None:
+        """
+        스트리밍 처리 로직 (기본 구현: 입력을 모두 모은 뒤 process 실행)
+
+        앞 단계는 처리 결과를 컨텍스트에도 기록하므로 입력 큐는 끝까지 비우기만 하고,
+        process가 컨텍스트를 갱신한 뒤 그 결과를 다음 단계의 입력 형태로 전달합니다.
+        항목 단위로 처리하려면 하위 클래스에서 재정의합니다.
+
+        Args:
+            context: 파이프라인 컨텍스트
+            in_queue: 입력 큐 (_END 표식으로 끝남)
+            out_queue: 출력 큐
+        """
+        await _drain(in_queue)
+        await self.process(context)
+        await _forward(context, out_queue)
+
 
 class DataCleaningStep(PipelineStep):
     """
@@ -137,26 +260,24 @@ class DataCleaningStep(PipelineStep):
         - 텍스트 정규화 (공백, 특수문자)
         - 중복 데이터 제거
         """
-        cleaned_policies = []
-
-        for policy in context.crawl_result.policies:
-            # 빈 데이터 스킵
-            if not policy.content.strip():
-                continue
-
-            # 텍스트 정규화
-            cleaned_content = self._normalize_text(policy.content)
-
-            # Vector DB 포맷으로 변환
-            db_format = policy.to_vector_db_format(
-                context.crawl_result.source_name,
-                policy.official_link
-            )
-
-            # 정제된 콘텐츠로 업데이트
-            db_format["content"] = cleaned_content
-
-            cleaned_policies.append(db_format)
+        # 반복문 내 속성/메서드 조회를 줄이기 위해 지역 변수로 바인딩
+        normalize = self._normalize_text
+        to_db_format = PolicyData.to_vector_db_format
+        source_tier = context.crawl_result.source_tier
+        # 같은 실행의 정책은 게시 연도를 공유하므로 시계는 한 번만 조회
+        publish_year = datetime.now().year
+
+        # Vector DB 포맷으로 변환하고 정제된 콘텐츠로 교체 (빈 데이터 스킵)
+        cleaned_policies = [
+            {
+                **to_db_format(
+                    policy, source_tier, policy.official_link, publish_year
+                ),
+                "content": normalize(content)
+            }
+            for policy in context.crawl_result.policies
+            if (content := policy.content).strip()
+        ]
 
         context.processed_policies = cleaned_policies
         context.metadata["cleaning_stats"] = {
@@ -166,23 +287,302 @@ class DataCleaningStep(PipelineStep):
 
         return context
 
+    async def process_stream(
+        self,
+        context: PipelineContext,
+        in_queue: asyncio.Queue,
+        out_queue: asyncio.Queue
+    ) -> None:
+        """
+        데이터 정제 스트리밍 처리
+
+        PolicyData를 하나씩 받아 정제된 Vector DB 포맷으로 전달합니다.
+        """
+        normalize = self._normalize_text
+        to_db_format = PolicyData.to_vector_db_format
+        source_tier = context.crawl_result.source_tier
+        # 같은 실행의 정책은 게시 연도를 공유하므로 시계는 한 번만 조회
+        publish_year = datetime.now().year
+        original_count = 0
+
+        while (policy := await in_queue.get()) is not _END:
+            original_count += 1
+            if not (content := policy.content).strip():
+                continue
+
+            cleaned = {
+                **to_db_format(
+                    policy, source_tier, policy.official_link, publish_year
+                ),
+                "content": normalize(content)
+            }
+            context.processed_policies.append(cleaned)
+            await out_queue.put(cleaned)
+
+        context.metadata["cleaning_stats"] = {
+            "original_count": original_count,
+            "cleaned_count": len(context.processed_policies)
+        }
+
     def _normalize_text(self, text: str) -> str:
         """텍스트 정규화"""
-        import re
+        # 연속된 공백을 단일 공백으로 변환 후 앞뒤 공백 제거
+        # (str.split은 정규식 엔진 없이 C 수준에서 공백을 분리)
+        text = ' '.join(text.split())
 
-        # 연속된 공백을 단일 공백으로
-        text = re.sub(r'\s+', ' ', text)
+        # HTML 엔티티 변환 (한 번의 순회로 모든 엔티티 치환)
+        return _ENTITY_RE.sub(lambda m: _ENTITY_MAP[m.group(1)], text)
 
-        # 앞뒤 공백 제거
-        text = text.strip()
 
-        # HTML 엔티티 변환
-        text = text.replace('&nbsp;', ' ')
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
+class EmbeddingCache(ABC):
+    """
+    임베딩 캐시 인터페이스
 
-        return text
+    콘텐츠 해시 키로 이전에 생성한 임베딩을 조회/저장합니다.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """캐시된 임베딩 조회 (없으면 None)"""
+        pass
+
+    @abstractmethod
+    def set_many(self, items: Dict[str, np.ndarray]) -> None:
+        """여러 임베딩을 한 번에 저장"""
+        pass
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """여러 임베딩을 한 번에 조회 (캐시에 있는 키만 포함)"""
+        found = {}
+        for key in keys:
+            cached = self.get(key)
+            if cached is not None:
+                found[key] = cached
+        return found
+
+    def get_similar(self, namespace: str, content: str) -> Optional[np.ndarray]:
+        """유사 콘텐츠의 캐시된 임베딩 조회 (미지원 캐시는 None)"""
+        return None
+
+    def add_fingerprints(self, namespace: str, contents: Dict[str, str]) -> None:
+        """근사 조회용 콘텐츠 지문 저장 (미지원 캐시는 무시)"""
+        pass
+
+    def close(self) -> None:
+        """캐시 리소스 정리 (필요한 하위 클래스에서 재정의)"""
+        pass
+
+
+class SQLiteEmbeddingCache(EmbeddingCache):
+    """
+    SQLite 기반 영구 임베딩 캐시
+
+    임베딩을 float32 바이트열로 저장하여 파이프라인 실행 간에
+    재사용합니다. 변경되지 않은 정책은 API 호출 없이 캐시에서 제공됩니다.
+    fuzzy_distance를 지정하면 SimHash 지문의 해밍 거리가 그 이하인
+    캐시 항목의 임베딩도 재사용합니다. 지문은 금액, 연도 같은 숫자 변경을
+    거의 구분하지 못하므로 갱신된 정책이 이전 임베딩을 받지 않도록 기본값은 끕니다.
+
+    Example:
+        >>> cache = SQLiteEmbeddingCache("data/embedding_cache.db")
+        >>> step = EmbeddingGenerationStep(api_key, cache=cache)
+    """
+
+    def __init__(
+        self,
+        db_path: str = "data/embedding_cache.db",
+        fuzzy_distance: Optional[int] = None
+    ):
+        """
+        캐시 초기화
+
+        Args:
+            db_path: SQLite 파일 경로
+            fuzzy_distance: 근사 적중으로 인정할 최대 해밍 거리
+                (None이면 근사 조회 미사용, 최대 3)
+        """
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        if fuzzy_distance is not None:
+            # 블록 분할 조회는 거리 3 이하만 빠짐없이 찾을 수 있음
+            fuzzy_distance = min(fuzzy_distance, _SIMHASH_BLOCKS - 1)
+        self._fuzzy_distance = fuzzy_distance
+
+        self._conn = sqlite3.connect(db_path)
+        self._configure_connection(in_memory=db_path == ":memory:")
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        """
+        테이블/인덱스 생성 (private)
+
+        PRAGMA user_version이 현재 스키마 버전과 같으면 DDL을 건너뛰어
+        짧게 실행되는 프로세스가 매번 스키마를 확인하지 않도록 합니다.
+        """
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version == _CACHE_SCHEMA_VERSION:
+            return
+
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key BLOB PRIMARY KEY, vec BLOB NOT NULL)"
+            )
+
+            # rowid 테이블과 key 자동 인덱스에 중복 저장하지 않도록 WITHOUT ROWID 사용
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS fingerprints "
+                "(key BLOB PRIMARY KEY, namespace TEXT NOT NULL, "
+                "simhash INTEGER NOT NULL, b0 INTEGER NOT NULL, b1 INTEGER NOT NULL, "
+                "b2 INTEGER NOT NULL, b3 INTEGER NOT NULL) WITHOUT ROWID"
+            )
+
+            for i in range(_SIMHASH_BLOCKS):
+                # 블록 인덱스에 simhash와 key를 포함해 후보 조회가 테이블 행을 읽지 않도록 함
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS fingerprints_cover_b{i} "
+                    f"ON fingerprints (namespace, b{i}, simhash, key)"
+                )
+            self._conn.execute(f"PRAGMA user_version = {_CACHE_SCHEMA_VERSION}")
+
+    def _configure_connection(self, in_memory: bool) -> None:
+        """
+        SQLite 성능 설정 적용 (private)
+
+        WAL 모드와 synchronous=NORMAL로 커밋마다 fsync하지 않고
+        체크포인트 시점에만 동기화하며, mmap으로 조회 시 read() 호출을 줄입니다.
+        여러 파이프라인이 같은 파일을 쓸 때는 즉시 실패하지 않고 잠금을 기다리며,
+        WAL 파일은 작은 체크포인트로 나눠 비워 크기를 제한합니다.
+
+        Args:
+            in_memory: 메모리 DB 여부 (WAL/mmap 미적용)
+        """
+        if self._conn.execute("PRAGMA page_count").fetchone()[0] == 0:
+            # 새 DB는 테이블 생성과 WAL 전환 전에 8KB 페이지로 설정
+            # (1536차원 float32 임베딩 6KB가 오버플로 페이지 없이 한 페이지에 저장됨)
+            self._conn.execute("PRAGMA page_size=8192")
+            # 임베딩 교체로 생긴 빈 페이지를 close() 시 조금씩 OS에 반환
+            self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+
+        if not in_memory:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+            self._conn.execute("PRAGMA busy_timeout=5000")
+            self._conn.execute("PRAGMA wal_autocheckpoint=1000")
+            self._conn.execute("PRAGMA journal_size_limit=67108864")  # 64MB
+        self._conn.execute("PRAGMA trusted_schema=OFF")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-65536")  # 64MB
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """캐시된 임베딩 조회"""
+        row = self._conn.execute(
+            "SELECT vec FROM embeddings WHERE key = ?",
+            (bytes.fromhex(key),)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        return np.frombuffer(row[0], dtype=np.float32)
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """여러 임베딩을 IN 조회로 한 번에 조회 (900개 단위)"""
+        found: Dict[str, np.ndarray] = {}
+
+        for start in range(0, len(keys), _SQLITE_IN_CHUNK):
+            chunk = [
+                bytes.fromhex(key) for key in keys[start:start + _SQLITE_IN_CHUNK]
+            ]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT key, vec FROM embeddings WHERE key IN ({placeholders})",
+                chunk
+            )
+            for key, vec in rows:
+                found[key.hex()] = np.frombuffer(vec, dtype=np.float32)
+
+        return found
+
+    def set_many(self, items: Dict[str, np.ndarray]) -> None:
+        """여러 임베딩을 한 트랜잭션으로 저장"""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vec) VALUES (?, ?)",
+                [
+                    (
+                        bytes.fromhex(key),
+                        np.asarray(embedding, dtype=np.float32).tobytes()
+                    )
+                    for key, embedding in items.items()
+                ]
+            )
+
+    def get_similar(self, namespace: str, content: str) -> Optional[np.ndarray]:
+        """
+        SimHash 지문이 가장 가까운 캐시 항목의 임베딩 조회
+
+        Args:
+            namespace: 지문 네임스페이스 (임베딩 모델명)
+            content: 조회할 콘텐츠
+
+        Returns:
+            Optional[np.ndarray]: 거리 fuzzy_distance 이하인 항목의 임베딩
+        """
+        if self._fuzzy_distance is None:
+            return None
+
+        fingerprint = _simhash(content)
+        # 후보는 커버링 인덱스에서 지문만 읽고, 임베딩은 가장 가까운 항목만 조회
+        rows = self._conn.execute(
+            _SIMHASH_CANDIDATES_SQL,
+            (namespace, *_simhash_blocks(fingerprint))
+        )
+
+        best_key = None
+        best_distance = self._fuzzy_distance + 1
+
+        for key, stored in rows:
+            # SQLite INTEGER는 부호 있는 64비트이므로 부호 없는 값으로 복원
+            distance = (fingerprint ^ (stored & 0xFFFFFFFFFFFFFFFF)).bit_count()
+            if distance < best_distance:
+                best_key, best_distance = key, distance
+
+        if best_key is None:
+            return None
+
+        return self.get(best_key.hex())
+
+    def add_fingerprints(self, namespace: str, contents: Dict[str, str]) -> None:
+        """콘텐츠 지문을 한 트랜잭션으로 저장"""
+        if self._fuzzy_distance is None:
+            return
+
+        rows = []
+        for key, content in contents.items():
+            fingerprint = _simhash(content)
+            signed = fingerprint - (1 << 64) if fingerprint >> 63 else fingerprint
+            rows.append((
+                bytes.fromhex(key), namespace, signed,
+                *_simhash_blocks(fingerprint)
+            ))
+
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO fingerprints "
+                "(key, namespace, simhash, b0, b1, b2, b3) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def close(self) -> None:
+        """DB 연결 종료 (종료 전 빈 페이지 반환 및 쿼리 플래너 통계 갱신)"""
+        # execute()는 한 단계만 실행해 페이지 하나만 반환하므로 executescript 사용
+        self._conn.executescript("PRAGMA incremental_vacuum(1000);")
+        self._conn.execute("PRAGMA optimize")
+        self._conn.close()
 
 
 class EmbeddingGenerationStep(PipelineStep):
@@ -190,19 +590,43 @@ class EmbeddingGenerationStep(PipelineStep):
     임베딩 생성 단계
 
     정제된 텍스트에 대한 벡터 임베딩을 생성합니다.
+    여러 정책을 하나의 요청으로 묶고, 배치 요청을 제한된 동시성으로
+    병렬 전송하여 API 왕복 횟수와 전체 소요 시간을 줄입니다.
+    캐시가 주어지면 콘텐츠가 동일한 정책은 API를 호출하지 않습니다.
     """
 
-    def __init__(self, openai_api_key: str, model: str = "text-embedding-ada-002"):
+    def __init__(
+        self,
+        openai_api_key: str,
+        model: str = "text-embedding-ada-002",
+        batch_size: int = 2048,
+        max_concurrency: int = 8,
+        max_retries: int = 5,
+        cache: Optional[EmbeddingCache] = None,
+        flush_interval: float = 0.5
+    ):
         """
         임베딩 생성 단계 초기화
 
         Args:
             openai_api_key: OpenAI API 키
             model: 임베딩 모델명
+            batch_size: 요청 하나에 담을 최대 입력 수 (API 한도 2048)
+            max_concurrency: 동시에 전송할 최대 배치 요청 수
+            max_retries: 요청 실패(429 포함) 시 최대 재시도 횟수
+            cache: 임베딩 캐시 (None이면 캐시 미사용, close() 시 함께 닫힘)
+            flush_interval: 스트리밍 시 미완성 배치를 전송하기까지 대기할 초
         """
         super().__init__()
         self._api_key = openai_api_key
         self._model = model
+        self._batch_size = batch_size
+        self._max_concurrency = max_concurrency
+        self._max_retries = max_retries
+        self._cache = cache
+        self._flush_interval = flush_interval
+        self._client: Optional[Any] = None
+        self._count_tokens: Optional[Callable[[str], int]] = None
 
     async def process(self, context: PipelineContext) -> PipelineContext:
         """
@@ -210,31 +634,37 @@ class EmbeddingGenerationStep(PipelineStep):
 
         OpenAI API를 사용하여 텍스트 임베딩을 생성합니다.
         """
-        try:
-            from openai import OpenAI
+        # 임베딩할 정책이 없으면 클라이언트를 만들지 않음
+        if not context.processed_policies:
+            return context
 
-            client = OpenAI(api_key=self._api_key)
-            embeddings = {}
-
-            for policy in context.processed_policies:
-                policy_id = policy["id"]
-                content = policy["content"]
-
-                # 임베딩 생성
-                response = client.embeddings.create(
-                    input=content[:8000],  # 토큰 제한
-                    model=self._model
-                )
-
-                embeddings[policy_id] = response.data[0].embedding
-
-                # Rate limit 방지
-                await asyncio.sleep(0.1)
+        try:
+            # 동일 콘텐츠를 가진 정책을 묶어 대표 콘텐츠 하나만 임베딩
+            groups = self._group_by_content(context.processed_policies)
+
+            # 캐시 조회: 적중한 콘텐츠는 API 호출 대상에서 제외
+            by_key, misses, fuzzy_hits = self._lookup_cache(groups)
+
+            if misses:
+                client = self._get_client()
+                by_key.update(await self._embed_misses(client, misses))
+
+            # 대표 임베딩을 같은 콘텐츠의 모든 정책에 할당
+            embeddings = {
+                policy["id"]: by_key[key]
+                for key, members in groups.items()
+                if key in by_key
+                for policy in members
+            }
 
             context.embeddings = embeddings
             context.metadata["embedding_stats"] = {
                 "generated_count": len(embeddings),
-                "model": self._model
+                "unique_count": len(groups),
+                "model": self._model,
+                "cache_hits": len(groups) - len(misses),
+                "cache_misses": len(misses) if self._cache is not None else 0,
+                "fuzzy_hits": fuzzy_hits
             }
 
         except ImportError:
@@ -244,53 +674,376 @@ class EmbeddingGenerationStep(PipelineStep):
 
         return context
 
+    async def process_stream(
+        self,
+        context: PipelineContext,
+        in_queue: asyncio.Queue,
+        out_queue: asyncio.Queue
+    ) -> None:
+        """
+        임베딩 생성 스트리밍 처리
+
+        정제된 정책을 batch_size만큼 모으거나 flush_interval 동안 입력이
+        없으면 배치를 전송하고, (정책, 임베딩) 쌍을 다음 단계로 전달합니다.
+        배치 요청은 max_concurrency까지 동시에 진행됩니다.
+        """
+        # 입력이 하나도 없으면 클라이언트를 만들지 않음
+        first = await in_queue.get()
+        if first is _END:
+            return
+
+        try:
+            client = self._get_client()
+        except ImportError:
+            self._logger.warning("OpenAI 라이브러리가 설치되지 않음. 임베딩 스킵.")
+            await _drain(in_queue)
+            return
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        stats = {
+            "unique_count": 0, "cache_hits": 0, "cache_misses": 0, "fuzzy_hits": 0
+        }
+
+        async def flush(batch: List[Dict[str, Any]]) -> None:
+            groups = self._group_by_content(batch)
+            by_key, misses, fuzzy_hits = self._lookup_cache(groups)
+
+            if misses:
+                async with semaphore:
+                    try:
+                        by_key.update(await self._embed_misses(client, misses))
+                    except Exception as e:
+                        context.errors.append(f"임베딩 생성 실패: {str(e)}")
+
+            stats["unique_count"] += len(groups)
+            stats["cache_hits"] += len(groups) - len(misses)
+            stats["fuzzy_hits"] += fuzzy_hits
+            if self._cache is not None:
+                stats["cache_misses"] += len(misses)
+
+            for key, members in groups.items():
+                if key not in by_key:
+                    continue
+                for policy in members:
+                    context.embeddings[policy["id"]] = by_key[key]
+                    await out_queue.put((policy, by_key[key]))
+
+        pending: List[asyncio.Task] = []
+        batch: List[Dict[str, Any]] = [first]
+
+        while True:
+            try:
+                item = await asyncio.wait_for(
+                    in_queue.get(),
+                    timeout=self._flush_interval if batch else None
+                )
+            except asyncio.TimeoutError:
+                # 입력이 뜸하면 미완성 배치라도 먼저 전송
+                pending.append(asyncio.create_task(flush(batch)))
+                batch = []
+                continue
+
+            if item is _END:
+                break
+
+            batch.append(item)
+            if len(batch) >= self._batch_size:
+                pending.append(asyncio.create_task(flush(batch)))
+                batch = []
+
+        if batch:
+            pending.append(asyncio.create_task(flush(batch)))
+
+        await asyncio.gather(*pending)
+
+        context.metadata["embedding_stats"] = {
+            "generated_count": len(context.embeddings),
+            "model": self._model,
+            **stats
+        }
+
+    async def close(self) -> None:
+        """OpenAI 클라이언트 연결과 임베딩 캐시 종료"""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+        if self._cache is not None:
+            # SQLite 연결은 생성한 스레드에서만 쓸 수 있으므로 이벤트 루프 스레드에서 닫음
+            self._cache.close()
+            self._cache = None
+
+    def _get_client(self) -> Any:
+        """
+        AsyncOpenAI 클라이언트 반환 (첫 사용 시 생성 후 재사용)
+
+        429 응답은 SDK가 Retry-After 헤더를 반영하여 재시도합니다.
+
+        Returns:
+            AsyncOpenAI: 연결 풀을 유지하는 클라이언트
+
+        Raises:
+            ImportError: openai 라이브러리가 없는 경우
+        """
+        if self._client is None:
+            from openai import AsyncOpenAI
+
+            self._client = AsyncOpenAI(
+                api_key=self._api_key,
+                max_retries=self._max_retries
+            )
+        return self._client
+
+    def _group_by_content(
+        self,
+        policies: List[Dict[str, Any]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        정책을 캐시 키(콘텐츠 해시)별로 묶음
+
+        Args:
+            policies: 정제된 정책 목록
+
+        Returns:
+            Dict[str, List[Dict]]: 캐시 키 -> 같은 콘텐츠의 정책 목록
+        """
+        groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        cache_key = self._cache_key
+        for policy in policies:
+            groups[cache_key(policy["content"])].append(policy)
+        return groups
+
+    def _lookup_cache(
+        self,
+        groups: Dict[str, List[Dict[str, Any]]]
+    ) -> Tuple[Dict[str, np.ndarray], List[Dict[str, Any]], int]:
+        """
+        캐시에서 임베딩 조회
+
+        정확히 일치하는 항목이 없으면 유사 콘텐츠의 임베딩을 찾습니다.
+
+        Args:
+            groups: 캐시 키별 정책 목록
+
+        Returns:
+            Tuple: (캐시 키 -> 임베딩, 캐시에 없는 임베딩 대상 목록, 근사 적중 수)
+        """
+        by_key: Dict[str, np.ndarray] = {}
+        misses: List[Dict[str, Any]] = []
+        fuzzy_hits = 0
+
+        if self._cache is None:
+            misses = [
+                {"id": key, "content": members[0]["content"]}
+                for key, members in groups.items()
+            ]
+            return by_key, misses, fuzzy_hits
+
+        # 정확히 일치하는 항목은 한 번의 일괄 조회로 확인
+        exact = self._cache.get_many(list(groups))
+
+        for key, members in groups.items():
+            content = members[0]["content"][:_MAX_EMBEDDING_CHARS]
+            cached = exact.get(key)
+            if cached is None:
+                cached = self._cache.get_similar(self._model, content)
+                fuzzy_hits += cached is not None
+
+            if cached is not None:
+                by_key[key] = cached
+            else:
+                misses.append({"id": key, "content": members[0]["content"]})
+
+        return by_key, misses, fuzzy_hits
+
+    async def _embed_misses(
+        self,
+        client: Any,
+        misses: List[Dict[str, Any]]
+    ) -> Dict[str, np.ndarray]:
+        """
+        캐시에 없는 콘텐츠를 임베딩하고 캐시에 저장
+
+        Args:
+            client: AsyncOpenAI 클라이언트
+            misses: 임베딩 대상 목록
+
+        Returns:
+            Dict[str, np.ndarray]: 캐시 키 -> 임베딩
+        """
+        generated = await self._embed_policies(client, misses)
+
+        if self._cache is not None:
+            self._cache.set_many(generated)
+            self._cache.add_fingerprints(self._model, {
+                item["id"]: item["content"][:_MAX_EMBEDDING_CHARS]
+                for item in misses
+                if item["id"] in generated
+            })
+
+        return generated
+
+    async def _embed_policies(
+        self,
+        client: Any,
+        policies: List[Dict[str, Any]]
+    ) -> Dict[str, np.ndarray]:
+        """
+        임베딩 대상 목록을 배치로 나누어 병렬로 임베딩 생성
+
+        Args:
+            client: AsyncOpenAI 클라이언트
+            policies: "id", "content" 키를 가진 임베딩 대상 목록
+
+        Returns:
+            Dict[str, np.ndarray]: 대상 ID -> 임베딩
+        """
+        # 길이 순으로 정렬한 뒤 토큰 예산과 입력 수 한도 안에서 배치를 채움
+        ordered = sorted(policies, key=lambda p: len(p["content"]), reverse=True)
+        count_tokens = self._get_token_counter()
+
+        batches: List[List[Dict[str, Any]]] = []
+        batch: List[Dict[str, Any]] = []
+        batch_tokens = 0
+
+        for policy in ordered:
+            tokens = count_tokens(policy["content"][:_MAX_EMBEDDING_CHARS])
+            if batch and (
+                batch_tokens + tokens > _MAX_BATCH_TOKENS
+                or len(batch) >= self._batch_size
+            ):
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+            batch.append(policy)
+            batch_tokens += tokens
+
+        if batch:
+            batches.append(batch)
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def embed_batch(batch: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+            async with semaphore:
+                response = await client.embeddings.create(
+                    input=[
+                        policy["content"][:_MAX_EMBEDDING_CHARS] for policy in batch
+                    ],
+                    model=self._model
+                )
+            # Python float 리스트 대신 float32 배열로 보관 (메모리 약 1/9)
+            return {
+                batch[item.index]["id"]: np.asarray(item.embedding, dtype=np.float32)
+                for item in response.data
+            }
+
+        embeddings: Dict[str, np.ndarray] = {}
+        for batch_embeddings in await asyncio.gather(
+            *(embed_batch(batch) for batch in batches)
+        ):
+            embeddings.update(batch_embeddings)
+
+        return embeddings
+
+    def _get_token_counter(self) -> Callable[[str], int]:
+        """
+        토큰 수 계산 함수 반환 (첫 사용 시 생성 후 재사용)
+
+        tiktoken을 사용할 수 없으면 문자 수로 추정합니다.
+        한국어는 대체로 글자당 1토큰 이상이므로 len // 4보다 안전합니다.
+
+        Returns:
+            Callable[[str], int]: 텍스트 -> 토큰 수
+        """
+        if self._count_tokens is None:
+            try:
+                import tiktoken
+
+                encoding = tiktoken.encoding_for_model(self._model)
+                self._count_tokens = lambda text: len(
+                    encoding.encode(text, disallowed_special=())
+                )
+            except Exception:
+                # 미설치, 미지원 모델, 인코딩 파일 다운로드 실패
+                self._count_tokens = len
+
+        return self._count_tokens
+
+    def _cache_key(self, content: str) -> str:
+        """
+        캐시 키 생성 (모델명 + 실제 임베딩 입력의 BLAKE2b 해시)
+
+        Args:
+            content: 정제된 정책 콘텐츠
+
+        Returns:
+            str: 16바이트 해시의 16진수 문자열
+        """
+        data = f"{self._model}|{content[:_MAX_EMBEDDING_CHARS]}".encode()
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
 
 class VectorDBInsertionStep(PipelineStep):
     """
     Vector DB 삽입 단계
 
     처리된 데이터를 Vector Database에 저장합니다.
+    업서트는 Pinecone 스레드 풀로 배치를 병렬 전송하며,
+    블로킹 호출은 별도 스레드에서 실행하여 이벤트 루프를 막지 않습니다.
     """
 
-    def __init__(self, pinecone_api_key: str, index_name: str):
+    def __init__(
+        self,
+        pinecone_api_key: str,
+        index_name: str,
+        pool_threads: int = 30,
+        batch_size: int = 100,
+        chunk_size: Optional[int] = None,
+        stream_flush_size: int = 100
+    ):
         """
         Vector DB 삽입 단계 초기화
 
         Args:
             pinecone_api_key: Pinecone API 키
             index_name: 인덱스 이름
+            pool_threads: 병렬 업서트에 사용할 스레드 수
+            batch_size: 업서트 요청 하나에 담을 벡터 수
+            chunk_size: 한 번에 동시 전송할 벡터 수 (대기 중인 요청 수 제한,
+                None이면 스레드 풀을 한 번에 채우는 pool_threads * batch_size)
+            stream_flush_size: 스트리밍 시 모아서 업서트할 벡터 수
         """
         super().__init__()
         self._api_key = pinecone_api_key
         self._index_name = index_name
+        self._pool_threads = pool_threads
+        self._batch_size = batch_size
+        self._chunk_size = chunk_size or pool_threads * batch_size
+        self._stream_flush_size = stream_flush_size
+        self._index: Optional[Any] = None
 
     async def process(self, context: PipelineContext) -> PipelineContext:
         """
         Vector DB 삽입 처리
         """
-        try:
-            from pinecone import Pinecone
+        # 삽입할 임베딩이 없으면 클라이언트를 만들지 않음
+        if not context.embeddings:
+            return context
 
-            pc = Pinecone(api_key=self._api_key)
-            index = pc.Index(self._index_name)
-
-            vectors = []
-
-            for policy in context.processed_policies:
-                policy_id = policy["id"]
-
-                if policy_id not in context.embeddings:
-                    continue
+        try:
+            index = self._get_index()
 
-                vectors.append({
-                    "id": policy_id,
-                    "values": context.embeddings[policy_id],
-                    "metadata": policy["metadata"]
-                })
+            # 임베딩이 있는 정책만 한 번의 조회로 골라 벡터 구성
+            embeddings = context.embeddings
+            vectors = [
+                {"id": policy_id, "values": values, "metadata": policy["metadata"]}
+                for policy in context.processed_policies
+                if (values := embeddings.get(policy_id := policy["id"])) is not None
+            ]
 
-            # 배치 업서트
+            # 병렬 배치 업서트 (이벤트 루프 블로킹 방지)
             if vectors:
-                index.upsert(vectors=vectors, batch_size=100)
+                await asyncio.to_thread(self._parallel_upsert, index, vectors)
 
             context.metadata["insertion_stats"] = {
                 "inserted_count": len(vectors),
@@ -304,6 +1057,123 @@ class VectorDBInsertionStep(PipelineStep):
 
         return context
 
+    async def process_stream(
+        self,
+        context: PipelineContext,
+        in_queue: asyncio.Queue,
+        out_queue: asyncio.Queue
+    ) -> None:
+        """
+        Vector DB 삽입 스트리밍 처리
+
+        (정책, 임베딩) 쌍을 stream_flush_size만큼 모을 때마다
+        업서트를 시작하고, 업서트가 진행되는 동안 다음 입력을 받습니다.
+        """
+        # 입력이 하나도 없으면 클라이언트를 만들지 않음
+        item = await in_queue.get()
+        if item is _END:
+            return
+
+        try:
+            index = self._get_index()
+        except ImportError:
+            self._logger.warning("Pinecone 라이브러리가 설치되지 않음. 삽입 스킵.")
+            await _drain(in_queue)
+            return
+
+        pending: List[asyncio.Task] = []
+        batches: List[List[Dict[str, Any]]] = []
+        buffer: List[Dict[str, Any]] = []
+
+        def flush() -> None:
+            batches.append(buffer)
+            pending.append(asyncio.create_task(
+                asyncio.to_thread(self._parallel_upsert, index, buffer)
+            ))
+
+        while item is not _END:
+            policy, embedding = item
+            buffer.append({
+                "id": policy["id"],
+                "values": embedding,
+                "metadata": policy["metadata"]
+            })
+            if len(buffer) >= self._stream_flush_size:
+                flush()
+                buffer = []
+
+            item = await in_queue.get()
+
+        if buffer:
+            flush()
+
+        # 업서트에 성공한 배치만 삽입 수에 포함
+        inserted_count = 0
+        outcomes = await asyncio.gather(*pending, return_exceptions=True)
+        for batch, outcome in zip(batches, outcomes):
+            if isinstance(outcome, Exception):
+                context.errors.append(f"Vector DB 삽입 실패: {str(outcome)}")
+            else:
+                inserted_count += len(batch)
+
+        context.metadata["insertion_stats"] = {
+            "inserted_count": inserted_count,
+            "index_name": self._index_name
+        }
+
+    async def close(self) -> None:
+        """Pinecone 인덱스의 스레드 풀과 연결 종료"""
+        if self._index is not None:
+            await asyncio.to_thread(self._index.close)
+            self._index = None
+
+    def _get_index(self) -> Any:
+        """
+        Pinecone 인덱스 반환 (첫 사용 시 생성 후 재사용)
+
+        인덱스 객체는 스레드 안전하므로 실행 간에 공유하며,
+        pool_threads 스레드 풀도 한 번만 만들어집니다.
+
+        Returns:
+            Index: Pinecone 인덱스
+
+        Raises:
+            ImportError: pinecone 라이브러리가 없는 경우
+        """
+        if self._index is None:
+            from pinecone import Pinecone
+
+            pc = Pinecone(api_key=self._api_key)
+            self._index = pc.Index(self._index_name, pool_threads=self._pool_threads)
+        return self._index
+
+    def _parallel_upsert(self, index: Any, vectors: List[Dict[str, Any]]) -> None:
+        """
+        벡터를 배치로 나누어 병렬 업서트 (블로킹)
+
+        chunk_size 단위로 배치 요청을 async_req로 동시에 제출하고
+        모든 응답을 기다린 뒤 다음 청크로 넘어갑니다.
+        임베딩 배열은 SDK가 요구하는 리스트로 요청 직전에 변환합니다.
+
+        Args:
+            index: Pinecone 인덱스
+            vectors: 업서트할 벡터 목록
+        """
+        for start in range(0, len(vectors), self._chunk_size):
+            chunk = vectors[start:start + self._chunk_size]
+            async_results = [
+                index.upsert(
+                    vectors=[
+                        {**vector, "values": vector["values"].tolist()}
+                        for vector in chunk[i:i + self._batch_size]
+                    ],
+                    async_req=True
+                )
+                for i in range(0, len(chunk), self._batch_size)
+            ]
+            for result in async_results:
+                result.get()
+
 
 class DataPipeline:
     """
@@ -318,11 +1188,18 @@ class DataPipeline:
         >>> pipeline.add_step(VectorDBInsertionStep(api_key, index))
         >>>
         >>> result = await pipeline.execute(crawl_result)
+        >>> await pipeline.close()
     """
 
-    def __init__(self):
-        """파이프라인 초기화"""
+    def __init__(self, queue_size: int = 256):
+        """
+        파이프라인 초기화
+
+        Args:
+            queue_size: 스트리밍 모드에서 단계 사이 큐의 최대 크기
+        """
         self._steps: List[PipelineStep] = []
+        self._queue_size = queue_size
         self._logger = logging.getLogger(__name__)
 
     def add_step(self, step: PipelineStep) -> 'DataPipeline':
@@ -335,10 +1212,6 @@ class DataPipeline:
         Returns:
             DataPipeline: 체이닝을 위한 self
         """
-        if self._steps:
-            # 마지막 단계에 연결
-            self._steps[-1].set_next(step)
-
         self._steps.append(step)
         return self
 
@@ -358,13 +1231,17 @@ class DataPipeline:
         # 컨텍스트 생성
         context = PipelineContext(crawl_result=crawl_result)
 
+        if not crawl_result.policies:
+            self._logger.info("빈 크롤링 결과, 파이프라인 스킵")
+            return context
+
         self._logger.info(
             f"파이프라인 실행 시작: {len(self._steps)}개 단계, "
             f"{len(crawl_result.policies)}개 정책"
         )
 
-        # 첫 번째 단계부터 실행
-        context = await self._steps[0].handle(context)
+        # 단계들을 큐로 연결하여 동시에 실행
+        await self._execute_streaming(context)
 
         self._logger.info(
             f"파이프라인 완료: {len(context.processed_policies)}개 처리됨, "
@@ -373,12 +1250,87 @@ class DataPipeline:
 
         return context
 
+    async def execute_many(
+        self,
+        crawl_results: List[CrawlResult],
+        max_concurrency: int = 4
+    ) -> List[PipelineContext]:
+        """
+        여러 크롤링 결과를 동시에 처리
+
+        단계와 클라이언트를 공유하므로 출처별 정제, 임베딩, 업서트가
+        서로 겹쳐 진행됩니다.
+
+        Args:
+            crawl_results: 크롤링 결과 목록
+            max_concurrency: 동시에 실행할 최대 파이프라인 수
+
+        Returns:
+            List[PipelineContext]: 입력 순서와 같은 순서의 처리 결과
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(crawl_result: CrawlResult) -> PipelineContext:
+            async with semaphore:
+                return await self.execute(crawl_result)
+
+        return list(await asyncio.gather(
+            *(run(crawl_result) for crawl_result in crawl_results)
+        ))
+
+    async def close(self) -> None:
+        """모든 단계의 클라이언트 연결 종료"""
+        for step in self._steps:
+            await step.close()
+
+    async def _execute_streaming(self, context: PipelineContext) -> None:
+        """
+        스트리밍 모드 실행 (private)
+
+        각 단계를 제한된 크기의 큐로 연결하여 동시에 실행합니다.
+        한 단계가 실패하면 나머지 단계를 취소합니다.
+
+        Args:
+            context: 파이프라인 컨텍스트
+        """
+        queues = [asyncio.Queue(maxsize=self._queue_size) for _ in self._steps]
+        # 마지막 단계의 출력 큐는 소비자가 없으므로 크기 제한 없음
+        queues.append(asyncio.Queue())
+
+        async def feed() -> None:
+            for policy in context.crawl_result.policies:
+                await queues[0].put(policy)
+            await queues[0].put(_END)
+
+        tasks = [asyncio.create_task(feed())]
+        tasks.extend(
+            asyncio.create_task(step.stream(context, queues[i], queues[i + 1]))
+            for i, step in enumerate(self._steps)
+        )
+
+        try:
+            await asyncio.gather(*tasks)
+        except Exception:
+            # 오류는 해당 단계에서 context.errors에 기록됨
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def __aenter__(self) -> 'DataPipeline':
+        """비동기 컨텍스트 진입"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """비동기 컨텍스트 종료 시 연결 정리"""
+        await self.close()
+
     @classmethod
     def create_default(
         cls,
         openai_api_key: str,
         pinecone_api_key: str,
-        index_name: str
+        index_name: str,
+        cache_path: Optional[str] = "data/embedding_cache.db"
     ) -> 'DataPipeline':
         """
         기본 파이프라인 생성
@@ -387,13 +1339,16 @@ class DataPipeline:
             openai_api_key: OpenAI API 키
             pinecone_api_key: Pinecone API 키
             index_name: 인덱스 이름
+            cache_path: 임베딩 캐시 SQLite 파일 경로 (None이면 캐시 미사용)
 
         Returns:
             DataPipeline: 구성된 파이프라인
         """
+        cache = SQLiteEmbeddingCache(cache_path) if cache_path else None
+
         pipeline = cls()
         pipeline.add_step(DataCleaningStep())
-        pipeline.add_step(EmbeddingGenerationStep(openai_api_key))
+        pipeline.add_step(EmbeddingGenerationStep(openai_api_key, cache=cache))
         pipeline.add_step(VectorDBInsertionStep(pinecone_api_key, index_name))
 
         return pipeline
@@ -6,7 +6,7 @@
 =============================================================================
 
 크롤링 작업을 정기적으로 실행하는 스케줄러입니다.
-APScheduler를 사용하여 Cron 표현식 기반 스케줄링을 지원합니다.
+croniter를 사용하여 Cron 표현식 기반 스케줄링을 지원합니다.
 
 Author: Youth Policy System Team
 Version: 1.0.0
@@ -14,13 +14,18 @@ Version: 1.0.0
 """
 
 import asyncio
-from typing import Dict, List, Optional, Callable, Any
+import heapq
+import inspect
+from typing import Dict, List, Optional, Callable, Any, Tuple
 from datetime import datetime
 from dataclasses import dataclass, field
 import logging
 
+from croniter import croniter
+
 from .factory import PolicyCrawlerFactory
 from .base_crawler import CrawlResult
+from .pipeline import DataPipeline
 
 
 @dataclass
@@ -57,9 +62,16 @@ class CrawlerScheduler:
     정기적인 크롤링 작업을 관리하고 실행합니다.
     옵저버 패턴을 통해 작업 결과를 외부에 알립니다.
 
+    주기적으로 작업 목록을 폴링하지 않고, 가장 이른 다음 실행 시각까지
+    대기한 뒤 실행합니다. 작업이 추가/활성화되면 즉시 다시 계산합니다.
+    파이프라인이 주어지면 함께 실행된 작업들의 결과를 한꺼번에 처리합니다.
+
     Attributes:
         _jobs (Dict): 등록된 작업 목록
+        _heap (List): (다음 실행 시각, 작업 ID) 최소 힙
         _is_running (bool): 스케줄러 실행 상태
+        _wakeup (asyncio.Event): 작업 변경 시 대기 중인 루프를 깨우는 이벤트
+        _job_semaphore (asyncio.Semaphore): 동시에 실행할 작업 수 제한
         _logger (logging.Logger): 로거
         _observers (List): 옵저버 콜백 목록
 
@@ -77,18 +89,37 @@ class CrawlerScheduler:
         >>> await scheduler.start()
     """
 
-    def __init__(self):
-        """스케줄러 초기화"""
+    def __init__(
+        self,
+        max_concurrent_jobs: int = 4,
+        pipeline: Optional[DataPipeline] = None
+    ):
+        """
+        스케줄러 초기화
+
+        Args:
+            max_concurrent_jobs: 동시에 실행할 최대 작업(및 파이프라인) 수
+            pipeline: 크롤링 결과를 처리할 데이터 파이프라인 (None이면 미사용)
+        """
         # Private 속성
+        self._max_concurrent_jobs = max_concurrent_jobs
+        self._pipeline = pipeline
         self._jobs: Dict[str, ScheduledJob] = {}
+        self._heap: List[Tuple[datetime, str]] = []
         self._is_running: bool = False
         self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        # 즉시 실행과 예약 실행이 함께 쓰는 동시 실행 제한
+        self._job_semaphore = asyncio.Semaphore(max_concurrent_jobs)
         self._logger = logging.getLogger(__name__)
 
-        # 옵저버 콜백
-        self._on_complete_callbacks: List[Callable] = []
-        self._on_error_callbacks: List[Callable] = []
-        self._on_start_callbacks: List[Callable] = []
+        # 옵저버 콜백 (등록 시 코루틴 함수 여부로 분류)
+        self._on_complete_async: List[Callable] = []
+        self._on_complete_sync: List[Callable] = []
+        self._on_error_async: List[Callable] = []
+        self._on_error_sync: List[Callable] = []
+        self._on_start_async: List[Callable] = []
+        self._on_start_sync: List[Callable] = []
 
     # =========================================================================
     # 프로퍼티
@@ -128,7 +159,7 @@ class CrawlerScheduler:
             str: 등록된 작업 ID
 
         Raises:
-            ValueError: 크롤러가 팩토리에 등록되지 않은 경우
+            ValueError: 크롤러가 팩토리에 등록되지 않았거나 Cron 표현식이 잘못된 경우
 
         Example:
             >>> # 매일 오전 6시 실행
@@ -141,6 +172,9 @@ class CrawlerScheduler:
         if not PolicyCrawlerFactory.is_registered(crawler_name):
             raise ValueError(f"등록되지 않은 크롤러: {crawler_name}")
 
+        if not croniter.is_valid(cron_expression):
+            raise ValueError(f"잘못된 Cron 표현식: {cron_expression}")
+
         # 작업 ID 생성
         if job_id is None:
             job_id = f"{crawler_name}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
@@ -150,10 +184,12 @@ class CrawlerScheduler:
             job_id=job_id,
             crawler_name=crawler_name,
             cron_expression=cron_expression,
-            enabled=enabled
+            enabled=enabled,
+            next_run=self._next_fire_time(cron_expression, datetime.now())
         )
 
         self._jobs[job_id] = job
+        self._schedule(job)
         self._logger.info(
             f"작업 등록: {job_id} ({crawler_name}, {cron_expression})"
         )
@@ -172,6 +208,7 @@ class CrawlerScheduler:
         """
         if job_id in self._jobs:
             del self._jobs[job_id]
+            self._wakeup.set()
             self._logger.info(f"작업 제거: {job_id}")
             return True
         return False
@@ -179,7 +216,10 @@ class CrawlerScheduler:
     def enable_job(self, job_id: str) -> bool:
         """작업 활성화"""
         if job_id in self._jobs:
-            self._jobs[job_id].enabled = True
+            job = self._jobs[job_id]
+            job.enabled = True
+            job.next_run = self._next_fire_time(job.cron_expression, datetime.now())
+            self._schedule(job)
             return True
         return False
 
@@ -187,6 +227,7 @@ class CrawlerScheduler:
         """작업 비활성화"""
         if job_id in self._jobs:
             self._jobs[job_id].enabled = False
+            self._wakeup.set()
             return True
         return False
 
@@ -205,7 +246,7 @@ class CrawlerScheduler:
         Args:
             callback: (job_id) -> None
         """
-        self._on_start_callbacks.append(callback)
+        self._register_callback(callback, self._on_start_async, self._on_start_sync)
 
     def on_complete(self, callback: Callable[[CrawlResult], None]) -> None:
         """
@@ -214,7 +255,7 @@ class CrawlerScheduler:
         Args:
             callback: (result) -> None
         """
-        self._on_complete_callbacks.append(callback)
+        self._register_callback(callback, self._on_complete_async, self._on_complete_sync)
 
     def on_error(self, callback: Callable[[str, Exception], None]) -> None:
         """
@@ -223,7 +264,7 @@ class CrawlerScheduler:
         Args:
             callback: (job_id, exception) -> None
         """
-        self._on_error_callbacks.append(callback)
+        self._register_callback(callback, self._on_error_async, self._on_error_sync)
 
     # =========================================================================
     # 스케줄러 제어
@@ -277,16 +318,18 @@ class CrawlerScheduler:
         """
         모든 활성화된 작업 즉시 실행
 
+        서로 독립적인 작업을 최대 max_concurrent_jobs개까지 동시에 실행합니다.
+
         Returns:
             Dict[str, CrawlResult]: 작업별 결과
         """
-        results = {}
+        jobs = [job for job in self._jobs.values() if job.enabled]
+        outcomes = await asyncio.gather(*(self._execute_limited(job) for job in jobs))
 
-        for job_id, job in self._jobs.items():
-            if job.enabled:
-                result = await self._execute_job(job)
-                if result:
-                    results[job_id] = result
+        results = {
+            job.job_id: result for job, result in zip(jobs, outcomes) if result
+        }
+        await self._process_results(list(results.values()))
 
         return results
 
@@ -298,22 +341,40 @@ class CrawlerScheduler:
         """
         스케줄러 메인 루프 (private)
 
-        1분마다 작업 목록을 확인하고 실행할 작업이 있으면 실행합니다.
+        힙에서 실행 시각이 된 작업을 꺼내 실행하고, 다음 실행 시각으로
+        다시 넣은 뒤 힙의 최상단 시각까지 대기합니다. 작업이 추가/제거되거나
+        활성 상태가 바뀌면 대기를 중단하고 다시 계산합니다.
+
+        제거/비활성화되었거나 실행 시각이 바뀐 작업의 힙 항목은
+        최상단에 올라올 때 버립니다 (지연 삭제).
         """
         while self._is_running:
             try:
-                current_time = datetime.now()
+                self._wakeup.clear()
+                now = datetime.now()
 
-                for job_id, job in self._jobs.items():
-                    if not job.enabled:
-                        continue
+                due: List[ScheduledJob] = []
 
-                    # Cron 표현식 평가 (간단한 구현)
-                    if self._should_run(job, current_time):
-                        asyncio.create_task(self._execute_job(job))
+                top = self._peek_heap()
+                while top is not None and top[0] <= now:
+                    job = self._jobs[top[1]]
+                    job.next_run = self._next_fire_time(job.cron_expression, now)
+                    heapq.heapreplace(self._heap, (job.next_run, job.job_id))
+                    due.append(job)
+                    top = self._peek_heap()
 
-                # 1분 대기
-                await asyncio.sleep(60)
+                if due:
+                    asyncio.create_task(self._run_due_jobs(due))
+
+                # 예정된 작업이 없으면 작업 변경 시까지 무기한 대기
+                timeout = None
+                if top is not None:
+                    timeout = max(0.0, (top[0] - datetime.now()).total_seconds())
+
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
 
             except asyncio.CancelledError:
                 break
@@ -321,53 +382,140 @@ class CrawlerScheduler:
                 self._logger.error(f"스케줄러 오류: {e}")
                 await asyncio.sleep(60)
 
-    def _should_run(self, job: ScheduledJob, current_time: datetime) -> bool:
+    async def _run_due_jobs(self, jobs: List[ScheduledJob]) -> None:
         """
-        작업 실행 여부 판단 (private)
+        같은 시각에 실행될 작업들을 동시에 실행하고 결과를 일괄 처리 (private)
 
-        간단한 Cron 표현식 파서입니다.
-        프로덕션에서는 croniter 라이브러리 사용을 권장합니다.
+        동시 실행 수는 run_all_now()와 같은 max_concurrent_jobs로 제한합니다.
 
         Args:
-            job: 작업 정보
-            current_time: 현재 시각
+            jobs: 실행할 작업 목록
+        """
+        results = await asyncio.gather(*(self._execute_limited(job) for job in jobs))
+        await self._process_results([result for result in results if result])
+
+    async def _process_results(self, results: List[CrawlResult]) -> None:
+        """
+        크롤링 결과를 파이프라인으로 일괄 처리 (private)
+
+        Args:
+            results: 크롤링 결과 목록
+        """
+        if self._pipeline is None or not results:
+            return
+
+        try:
+            await self._pipeline.execute_many(results, self._max_concurrent_jobs)
+        except Exception as e:
+            self._logger.error(f"파이프라인 처리 오류: {e}")
+
+    async def _execute_limited(self, job: ScheduledJob) -> Optional[CrawlResult]:
+        """
+        동시 실행 제한 안에서 작업 실행 (private)
+
+        Args:
+            job: 실행할 작업
 
         Returns:
-            bool: 실행 여부
+            Optional[CrawlResult]: 크롤링 결과
         """
-        # Cron 표현식 파싱: 분 시 일 월 요일
-        parts = job.cron_expression.split()
+        async with self._job_semaphore:
+            return await self._execute_job(job)
 
-        if len(parts) != 5:
-            return False
+    def _peek_heap(self) -> Optional[Tuple[datetime, str]]:
+        """
+        유효한 최상단 힙 항목 조회 (private)
 
-        minute, hour, day, month, weekday = parts
+        제거/비활성화되었거나 실행 시각이 바뀐 작업의 항목은 버립니다.
 
-        # 간단한 매칭 (정확한 구현은 croniter 사용)
-        checks = [
-            self._match_cron_field(minute, current_time.minute),
-            self._match_cron_field(hour, current_time.hour),
-            self._match_cron_field(day, current_time.day),
-            self._match_cron_field(month, current_time.month),
-            self._match_cron_field(weekday, current_time.weekday())
-        ]
+        Returns:
+            Optional[Tuple[datetime, str]]: (실행 시각, 작업 ID), 없으면 None
+        """
+        while self._heap:
+            run_at, job_id = self._heap[0]
+            job = self._jobs.get(job_id)
+            if job is not None and job.enabled and job.next_run == run_at:
+                return self._heap[0]
+            heapq.heappop(self._heap)
+        return None
+
+    def _schedule(self, job: ScheduledJob) -> None:
+        """
+        작업의 다음 실행 시각을 힙에 등록하고 스케줄러 루프를 깨움 (private)
 
-        return all(checks)
+        Args:
+            job: 등록할 작업
+        """
+        heapq.heappush(self._heap, (job.next_run, job.job_id))
+        self._wakeup.set()
 
-    def _match_cron_field(self, field: str, value: int) -> bool:
-        """Cron 필드 매칭 (private)"""
-        if field == '*':
-            return True
+    @staticmethod
+    def _next_fire_time(cron_expression: str, base: datetime) -> datetime:
+        """
+        기준 시각 이후의 다음 실행 시각 계산 (private)
 
-        if field.isdigit():
-            return int(field) == value
+        Args:
+            cron_expression: Cron 표현식
+            base: 기준 시각
 
-        if '/' in field:
-            # */5 형태 (5분마다)
-            _, interval = field.split('/')
-            return value % int(interval) == 0
+        Returns:
+            datetime: 다음 실행 시각
+        """
+        return croniter(cron_expression, base).get_next(datetime)
+
+    @staticmethod
+    def _register_callback(
+        callback: Callable,
+        async_callbacks: List[Callable],
+        sync_callbacks: List[Callable]
+    ) -> None:
+        """
+        콜백을 코루틴 함수 여부에 따라 분류하여 등록 (private)
 
-        return False
+        Args:
+            callback: 등록할 콜백
+            async_callbacks: 코루틴 함수 콜백 목록
+            sync_callbacks: 일반 함수 콜백 목록
+        """
+        if inspect.iscoroutinefunction(callback):
+            async_callbacks.append(callback)
+        else:
+            sync_callbacks.append(callback)
+
+    async def _notify(
+        self,
+        label: str,
+        async_callbacks: List[Callable],
+        sync_callbacks: List[Callable],
+        *args: Any
+    ) -> None:
+        """
+        등록된 콜백을 동시에 호출 (private)
+
+        코루틴 콜백은 이벤트 루프에서, 일반 콜백은 스레드에서 실행하므로
+        I/O를 수행하는 콜백이 서로를 기다리지 않습니다.
+
+        Args:
+            label: 로그에 표시할 콜백 종류
+            async_callbacks: 코루틴 함수 콜백 목록
+            sync_callbacks: 일반 함수 콜백 목록
+            *args: 콜백 인자
+        """
+        if not async_callbacks and not sync_callbacks:
+            return
+
+        callbacks = [*async_callbacks, *sync_callbacks]
+        results = await asyncio.gather(
+            *[callback(*args) for callback in async_callbacks],
+            *[asyncio.to_thread(callback, *args) for callback in sync_callbacks],
+            return_exceptions=True
+        )
+
+        # 콜백마다 try/except를 두지 않고 결과를 한 번에 검사
+        for callback, outcome in zip(callbacks, results):
+            if isinstance(outcome, Exception):
+                name = getattr(callback, "__qualname__", repr(callback))
+                self._logger.error(f"{label} 오류 ({name}): {outcome}")
 
     async def _execute_job(self, job: ScheduledJob) -> Optional[CrawlResult]:
         """
@@ -383,11 +531,9 @@ class CrawlerScheduler:
         job.last_run = datetime.now()
 
         # 시작 콜백 호출
-        for callback in self._on_start_callbacks:
-            try:
-                callback(job.job_id)
-            except Exception as e:
-                self._logger.error(f"시작 콜백 오류: {e}")
+        await self._notify(
+            "시작 콜백", self._on_start_async, self._on_start_sync, job.job_id
+        )
 
         try:
             # 크롤러 생성 및 실행
@@ -401,11 +547,9 @@ class CrawlerScheduler:
                 job.failure_count += 1
 
             # 완료 콜백 호출
-            for callback in self._on_complete_callbacks:
-                try:
-                    callback(result)
-                except Exception as e:
-                    self._logger.error(f"완료 콜백 오류: {e}")
+            await self._notify(
+                "완료 콜백", self._on_complete_async, self._on_complete_sync, result
+            )
 
             return result
 
@@ -414,11 +558,9 @@ class CrawlerScheduler:
             self._logger.error(f"작업 실행 오류 ({job.job_id}): {e}")
 
             # 오류 콜백 호출
-            for callback in self._on_error_callbacks:
-                try:
-                    callback(job.job_id, e)
-                except Exception as cb_e:
-                    self._logger.error(f"오류 콜백 실행 실패: {cb_e}")
+            await self._notify(
+                "오류 콜백", self._on_error_async, self._on_error_sync, job.job_id, e
+            )
 
             return None
 
@@ -40,7 +40,8 @@ from .providers import (
     GroqProvider,
     GeminiProvider,
     LLMResponse,
-    ProviderConfig
+    ProviderConfig,
+    shutdown_sessions
 )
 
 from .multi_llm import (
@@ -64,6 +65,7 @@ __all__ = [
     'GeminiProvider',
     'LLMResponse',
     'ProviderConfig',
+    'shutdown_sessions',
 
     # Orchestrator
     'MultiLLMOrchestrator',
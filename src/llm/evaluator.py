@@ -20,12 +20,54 @@ Version: 1.0.0
 """
 
 import re
+import asyncio
+import bisect
 import logging
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
 
 
+# =============================================================================
+# 미리 컴파일된 정규식 (응답마다 패턴을 다시 조회하지 않도록)
+# =============================================================================
+
+_SENTENCE_END_RE = re.compile(r'[.!?。]')
+_NUMBER_RE = re.compile(r'\d+(?:,\d{3})*(?:\.\d+)?')
+_URL_RE = re.compile(r'https?://|www\.|\.go\.kr|\.or\.kr')
+_PHONE_RE = re.compile(r'\d{2,4}[-\s]?\d{3,4}[-\s]?\d{4}')
+_WORD_RE = re.compile(r'[\w가-힣]+')
+_SPECIAL_CHAR_RE = re.compile(r'[^\w\s가-힣]')
+
+# 줄 머리에서 시작하는 구조화 요소 (한 번의 스캔으로 종류를 판별)
+# 세 갈래는 같은 줄 머리에서 동시에 매칭될 수 없고 줄바꿈을 넘지 않으므로
+# 개별 search와 결과가 같다.
+_LINE_STRUCTURE_RE = re.compile(
+    r'^(?:(?P<bullet_list>[\-\*\•]\s)'
+    r'|(?P<numbered_list>\d+[\.\)]\s)'
+    r'|(?P<headers>#+\s|\*\*.*\*\*))',
+    re.MULTILINE
+)
+_LINE_STRUCTURE_KINDS = frozenset(_LINE_STRUCTURE_RE.groupindex)
+
+# 점수 구간표 (bisect_right로 구간을 찾아 점수/등급을 조회)
+# 길이: 100자 미만 20, 300자 미만 40, 500자 미만 60, 1500자 미만 80, 그 이상 70 (너무 길면 감점)
+_LENGTH_EDGES = (100, 300, 500, 1500)
+_LENGTH_SCORES = (20, 40, 60, 80, 70)
+# 문장 수: 3문장 미만 0, 5문장 미만 10, 그 이상 20
+_SENTENCE_EDGES = (3, 5)
+_SENTENCE_SCORES = (0, 10, 20)
+# 총점 등급: 40점 미만 미흡, 60점 미만 보통, 80점 미만 우수, 그 이상 매우 우수
+_QUALITY_EDGES = (40, 60, 80)
+_QUALITY_LABELS = ("미흡", "보통", "우수", "매우 우수")
+
+# 이보다 짧은 응답은 어떤 전략에서도 선택될 수 없으므로 채점 없이 최저 점수 처리
+_MIN_CONTENT_LENGTH = 20
+
+# 관련성 평가 시 질문 키워드에서 제외할 불용어
+_STOPWORDS = frozenset({'은', '는', '이', '가', '을', '를', '에', '의', '로', '와', '과', '도'})
+
+
 # =============================================================================
 # 평가 기준 정의
 # =============================================================================
@@ -43,6 +85,15 @@ class EvaluationCriteria(Enum):
     STRUCTURE = "structure"          # 구조화
 
 
+# 평가 기준 키 (응답마다 열거형 멤버와 .value를 다시 조회하지 않도록 미리 바인딩)
+_K_COMPLETENESS = EvaluationCriteria.COMPLETENESS.value
+_K_ACCURACY = EvaluationCriteria.ACCURACY.value
+_K_RELEVANCE = EvaluationCriteria.RELEVANCE.value
+_K_CLARITY = EvaluationCriteria.CLARITY.value
+_K_STRUCTURE = EvaluationCriteria.STRUCTURE.value
+_CRITERIA_KEYS = tuple(c.value for c in EvaluationCriteria)
+
+
 @dataclass
 class EvaluationResult:
     """
@@ -64,6 +115,55 @@ class EvaluationResult:
     recommendation: str = ""
 
 
+@dataclass
+class _ContentStats:
+    """
+    응답 본문 통계 (private)
+
+    여러 평가 기준이 같은 본문을 반복해서 훑지 않도록
+    응답당 한 번만 계산하여 공유합니다.
+
+    Attributes:
+        length (int): 본문 길이
+        sentence_end_count (int): 문장 종결 부호 수
+        sentence_count (int): 비어 있지 않은 문장 수
+        sentence_total_length (int): 문장 길이 합 (앞뒤 공백 제외)
+        number_count (int): 숫자 토큰 수
+        special_count (int): 특수 문자 수
+    """
+    length: int
+    sentence_end_count: int
+    sentence_count: int
+    sentence_total_length: int
+    number_count: int
+    special_count: int
+
+
+def _scan_content(content: str) -> _ContentStats:
+    """
+    응답 본문 통계 계산
+
+    문장 분리 결과 하나로 문장 부호 수와 문장 길이를 함께 구합니다.
+
+    Args:
+        content: 응답 내용
+
+    Returns:
+        _ContentStats: 본문 통계
+    """
+    pieces = _SENTENCE_END_RE.split(content)
+    sentences = [s for s in (piece.strip() for piece in pieces) if s]
+
+    return _ContentStats(
+        length=len(content),
+        sentence_end_count=len(pieces) - 1,
+        sentence_count=len(sentences),
+        sentence_total_length=sum(map(len, sentences)),
+        number_count=len(_NUMBER_RE.findall(content)),
+        special_count=len(_SPECIAL_CHAR_RE.findall(content))
+    )
+
+
 # =============================================================================
 # 응답 평가기
 # =============================================================================
@@ -111,19 +211,20 @@ class ResponseEvaluator:
         self.use_llm_evaluation = use_llm_evaluation
 
         # 청년 정책 관련 키워드 (정확성 평가용)
-        self.policy_keywords = [
+        self.policy_keywords = (
             "청년", "지원", "정책", "신청", "자격", "조건",
             "금액", "기간", "서류", "문의", "홈페이지",
             "만원", "개월", "세", "소득", "자산"
-        ]
+        )
 
-        # 구조화 요소 패턴
+        # 줄 중간에도 나타나는 구조화 요소 패턴
+        # (리스트/헤더처럼 줄 머리에서 시작하는 요소는 _LINE_STRUCTURE_RE로 처리)
         self.structure_patterns = {
-            "markdown_table": r"\|.*\|.*\|",
-            "bullet_list": r"^[\-\*\•]\s",
-            "numbered_list": r"^\d+[\.\)]\s",
-            "headers": r"^#+\s|^\*\*.*\*\*",
-            "links": r"\[.*\]\(.*\)",
+            name: re.compile(pattern)
+            for name, pattern in {
+                "markdown_table": r"\|.*\|.*\|",
+                "links": r"\[.*\]\(.*\)",
+            }.items()
         }
 
     def evaluate_all(
@@ -143,31 +244,79 @@ class ResponseEvaluator:
         Returns:
             List[EvaluationResult]: 평가 결과 목록
         """
-        results = []
-
-        for response in responses:
-            if not response.success:
-                # 실패한 응답은 0점
-                results.append(EvaluationResult(
-                    provider=response.provider,
-                    total_score=0,
-                    weaknesses=[f"응답 실패: {response.error}"]
-                ))
-                continue
+        # 질문 키워드는 모든 응답에 공통이므로 한 번만 추출
+        query_words = self._extract_query_words(query)
 
-            result = self._evaluate_single(response, query, context)
-            results.append(result)
+        results = [
+            self.evaluate_one(response, query, context, query_words)
+            for response in responses
+        ]
 
         # 점수순 정렬
         results.sort(key=lambda x: x.total_score, reverse=True)
 
         return results
 
+    def evaluate_one(
+        self,
+        response: Any,  # LLMResponse
+        query: str,
+        context: Optional[str] = None,
+        query_words: Optional[frozenset] = None
+    ) -> EvaluationResult:
+        """
+        응답 하나 평가
+
+        Args:
+            response: LLM 응답
+            query: 원본 질문
+            context: RAG 컨텍스트
+            query_words: 미리 추출한 질문 키워드 (없으면 추출)
+
+        Returns:
+            EvaluationResult: 평가 결과
+        """
+        if not response.success:
+            # 실패한 응답은 0점
+            return EvaluationResult(
+                provider=response.provider,
+                total_score=0,
+                weaknesses=[f"응답 실패: {response.error}"]
+            )
+
+        return self._evaluate_single(response, query, context, query_words)
+
+    async def evaluate_one_async(
+        self,
+        response: Any,  # LLMResponse
+        query: str,
+        context: Optional[str] = None
+    ) -> EvaluationResult:
+        """
+        응답 하나 평가 (비동기)
+
+        응답이 도착하는 즉시 채점을 시작하여, 느린 제공자를 기다리는 동안
+        먼저 도착한 응답의 채점을 끝낼 수 있도록 합니다.
+
+        Args:
+            response: LLM 응답
+            query: 원본 질문
+            context: RAG 컨텍스트
+
+        Returns:
+            EvaluationResult: 평가 결과
+        """
+        if not response.success:
+            return self.evaluate_one(response, query, context)
+
+        return await asyncio.to_thread(self.evaluate_one, response, query, context)
+
     def _evaluate_single(
         self,
         response: Any,  # LLMResponse
         query: str,
-        context: Optional[str]
+        context: Optional[str],
+        query_words: Optional[frozenset] = None
     ) -> EvaluationResult:
         """
         단일 응답 평가
@@ -176,18 +325,34 @@ class ResponseEvaluator:
             response: LLM 응답
             query: 원본 질문
             context: RAG 컨텍스트
+            query_words: 미리 추출한 질문 키워드 (없으면 추출)
 
         Returns:
             EvaluationResult: 평가 결과
         """
         content = response.content
+
+        # 비어 있거나 너무 짧은 응답은 정규식 채점을 건너뜀 (길이를 점수로 사용)
+        if len(content) < _MIN_CONTENT_LENGTH:
+            weaknesses = ["응답이 거의 비어 있음"]
+            return EvaluationResult(
+                provider=response.provider,
+                total_score=float(len(content)),
+                criteria_scores=dict.fromkeys(_CRITERIA_KEYS, 0.0),
+                weaknesses=weaknesses,
+                recommendation=self._generate_recommendation(
+                    response.provider, len(content), [], weaknesses
+                )
+            )
+
+        stats = _scan_content(content)
         criteria_scores = {}
         strengths = []
         weaknesses = []
 
         # 1. 완성도 평가
-        completeness_score = self._evaluate_completeness(content, query)
-        criteria_scores[EvaluationCriteria.COMPLETENESS.value] = completeness_score
+        completeness_score = self._evaluate_completeness(content, query, stats)
+        criteria_scores[_K_COMPLETENESS] = completeness_score
 
         if completeness_score >= 80:
             strengths.append("질문에 대해 충분히 상세한 답변 제공")
@@ -195,8 +360,8 @@ class ResponseEvaluator:
             weaknesses.append("답변이 불완전하거나 너무 짧음")
 
         # 2. 정확성 평가
-        accuracy_score = self._evaluate_accuracy(content, context)
-        criteria_scores[EvaluationCriteria.ACCURACY.value] = accuracy_score
+        accuracy_score = self._evaluate_accuracy(content, context, stats)
+        criteria_scores[_K_ACCURACY] = accuracy_score
 
         if accuracy_score >= 80:
             strengths.append("정책 관련 키워드와 정보를 정확히 포함")
@@ -204,8 +369,8 @@ class ResponseEvaluator:
             weaknesses.append("정책 정보가 부족하거나 불명확")
 
         # 3. 관련성 평가
-        relevance_score = self._evaluate_relevance(content, query)
-        criteria_scores[EvaluationCriteria.RELEVANCE.value] = relevance_score
+        relevance_score = self._evaluate_relevance(content, query, query_words)
+        criteria_scores[_K_RELEVANCE] = relevance_score
 
         if relevance_score >= 80:
             strengths.append("질문과 높은 관련성")
@@ -213,8 +378,8 @@ class ResponseEvaluator:
             weaknesses.append("질문과의 관련성이 낮음")
 
         # 4. 명확성 평가
-        clarity_score = self._evaluate_clarity(content)
-        criteria_scores[EvaluationCriteria.CLARITY.value] = clarity_score
+        clarity_score = self._evaluate_clarity(content, stats)
+        criteria_scores[_K_CLARITY] = clarity_score
 
         if clarity_score >= 80:
             strengths.append("명확하고 이해하기 쉬운 문장")
@@ -223,7 +388,7 @@ class ResponseEvaluator:
 
         # 5. 구조화 평가
         structure_score = self._evaluate_structure(content)
-        criteria_scores[EvaluationCriteria.STRUCTURE.value] = structure_score
+        criteria_scores[_K_STRUCTURE] = structure_score
 
         if structure_score >= 80:
             strengths.append("잘 구조화된 포맷 (표, 리스트 등)")
@@ -253,7 +418,12 @@ class ResponseEvaluator:
             recommendation=recommendation
         )
 
-    def _evaluate_completeness(self, content: str, query: str) -> float:
+    def _evaluate_completeness(
+        self,
+        content: str,
+        query: str,
+        stats: Optional[_ContentStats] = None
+    ) -> float:
         """
         완성도 평가
 
@@ -262,38 +432,29 @@ class ResponseEvaluator:
         Args:
             content: 응답 내용
             query: 원본 질문
+            stats: 미리 계산한 본문 통계 (없으면 계산)
 
         Returns:
             float: 점수 (0-100)
         """
+        stats = stats or _scan_content(content)
         score = 0
 
         # 길이 기반 점수 (최소 100자, 최적 500-1500자)
-        length = len(content)
-        if length < 100:
-            score += 20
-        elif length < 300:
-            score += 40
-        elif length < 500:
-            score += 60
-        elif length < 1500:
-            score += 80
-        else:
-            score += 70  # 너무 길면 감점
+        score += _LENGTH_SCORES[bisect.bisect_right(_LENGTH_EDGES, stats.length)]
 
         # 문장 수 (최소 3문장)
-        sentences = len(re.findall(r'[.!?。]', content))
-        if sentences >= 5:
-            score += 20
-        elif sentences >= 3:
-            score += 10
+        score += _SENTENCE_SCORES[
+            bisect.bisect_right(_SENTENCE_EDGES, stats.sentence_end_count)
+        ]
 
         return min(score, 100)
 
     def _evaluate_accuracy(
         self,
         content: str,
-        context: Optional[str]
+        context: Optional[str],
+        stats: Optional[_ContentStats] = None
     ) -> float:
         """
         정확성 평가
@@ -303,35 +464,56 @@ class ResponseEvaluator:
         Args:
             content: 응답 내용
             context: RAG 컨텍스트
+            stats: 미리 계산한 본문 통계 (없으면 계산)
 
         Returns:
             float: 점수 (0-100)
         """
+        stats = stats or _scan_content(content)
         score = 0
 
-        # 정책 키워드 포함 여부
-        keyword_count = sum(
-            1 for keyword in self.policy_keywords
-            if keyword in content
-        )
+        # 정책 키워드 포함 여부 (8개에서 40점 상한이므로 그 이상은 세지 않음)
+        keyword_count = 0
+        for keyword in self.policy_keywords:
+            if keyword in content:
+                keyword_count += 1
+                if keyword_count >= 8:
+                    break
         score += min(keyword_count * 5, 40)
 
         # 숫자 정보 포함 (금액, 기간, 나이 등)
-        numbers = re.findall(r'\d+(?:,\d{3})*(?:\.\d+)?', content)
-        if len(numbers) >= 3:
+        if stats.number_count >= 3:
             score += 30
-        elif len(numbers) >= 1:
+        elif stats.number_count >= 1:
             score += 15
 
         # URL 또는 연락처 포함
-        if re.search(r'https?://|www\.|\.go\.kr|\.or\.kr', content):
+        if _URL_RE.search(content):
             score += 15
-        if re.search(r'\d{2,4}[-\s]?\d{3,4}[-\s]?\d{4}', content):
+        if _PHONE_RE.search(content):
             score += 15
 
         return min(score, 100)
 
-    def _evaluate_relevance(self, content: str, query: str) -> float:
+    @staticmethod
+    def _extract_query_words(query: str) -> frozenset:
+        """
+        질문에서 불용어를 제외한 주요 키워드 추출
+
+        Args:
+            query: 원본 질문
+
+        Returns:
+            frozenset: 소문자 키워드 집합
+        """
+        return frozenset(_WORD_RE.findall(query.lower())) - _STOPWORDS
+
+    def _evaluate_relevance(
+        self,
+        content: str,
+        query: str,
+        query_words: Optional[frozenset] = None
+    ) -> float:
         """
         관련성 평가
 
@@ -340,29 +522,39 @@ class ResponseEvaluator:
         Args:
             content: 응답 내용
             query: 원본 질문
+            query_words: 미리 추출한 질문 키워드 (없으면 추출)
 
         Returns:
             float: 점수 (0-100)
         """
-        # 질문에서 주요 키워드 추출
-        query_words = set(re.findall(r'[\w가-힣]+', query.lower()))
-
-        # 불용어 제거
-        stopwords = {'은', '는', '이', '가', '을', '를', '에', '의', '로', '와', '과', '도'}
-        query_words -= stopwords
+        if query_words is None:
+            query_words = self._extract_query_words(query)
 
         if not query_words:
             return 50
 
         # 답변에 키워드 포함 비율
-        content_lower = content.lower()
-        matched = sum(1 for word in query_words if word in content_lower)
+        # (키워드는 이미 소문자이므로 원문에서 먼저 찾고, 없을 때만 소문자 사본 생성)
+        content_lower = None
+        matched = 0
+        for word in query_words:
+            if word in content:
+                matched += 1
+                continue
+            if content_lower is None:
+                content_lower = content.lower()
+            if word in content_lower:
+                matched += 1
 
         score = (matched / len(query_words)) * 100
 
         return min(score, 100)
 
-    def _evaluate_clarity(self, content: str) -> float:
+    def _evaluate_clarity(
+        self,
+        content: str,
+        stats: Optional[_ContentStats] = None
+    ) -> float:
         """
         명확성 평가
 
@@ -370,21 +562,19 @@ class ResponseEvaluator:
 
         Args:
             content: 응답 내용
+            stats: 미리 계산한 본문 통계 (없으면 계산)
 
         Returns:
             float: 점수 (0-100)
         """
+        stats = stats or _scan_content(content)
         score = 70  # 기본 점수
 
-        # 문장 분리
-        sentences = re.split(r'[.!?。]', content)
-        sentences = [s.strip() for s in sentences if s.strip()]
-
-        if not sentences:
+        if not stats.sentence_count:
             return 30
 
         # 평균 문장 길이 (20-50자가 이상적)
-        avg_length = sum(len(s) for s in sentences) / len(sentences)
+        avg_length = stats.sentence_total_length / stats.sentence_count
 
         if 20 <= avg_length <= 50:
             score += 20
@@ -394,7 +584,7 @@ class ResponseEvaluator:
             score -= 20  # 너무 김
 
         # 특수 문자 과다 사용 체크
-        special_ratio = len(re.findall(r'[^\w\s가-힣]', content)) / max(len(content), 1)
+        special_ratio = stats.special_count / max(stats.length, 1)
         if special_ratio > 0.1:
             score -= 10
 
@@ -415,18 +605,27 @@ class ResponseEvaluator:
         score = 40  # 기본 점수
 
         # 각 구조화 요소 체크
+        found = set()
         for pattern_name, pattern in self.structure_patterns.items():
-            if re.search(pattern, content, re.MULTILINE):
-                if pattern_name == "markdown_table":
-                    score += 25  # 표는 높은 가산점
-                elif pattern_name in ["bullet_list", "numbered_list"]:
-                    score += 15
-                else:
-                    score += 10
-
-        # 줄바꿈으로 단락 구분
-        paragraphs = content.split('\n\n')
-        if len(paragraphs) >= 3:
+            if pattern.search(content):
+                found.add(pattern_name)
+
+        # 줄 머리 요소는 한 번의 스캔으로 모으고, 모두 찾으면 중단
+        for match in _LINE_STRUCTURE_RE.finditer(content):
+            found.add(match.lastgroup)
+            if _LINE_STRUCTURE_KINDS <= found:
+                break
+
+        for pattern_name in found:
+            if pattern_name == "markdown_table":
+                score += 25  # 표는 높은 가산점
+            elif pattern_name in ["bullet_list", "numbered_list"]:
+                score += 15
+            else:
+                score += 10
+
+        # 줄바꿈으로 단락 구분 (빈 줄 2개 이상이면 3단락 이상)
+        if content.count('\n\n') >= 2:
             score += 10
 
         return min(score, 100)
@@ -450,14 +649,7 @@ class ResponseEvaluator:
         Returns:
             str: 추천 이유
         """
-        if score >= 80:
-            quality = "매우 우수"
-        elif score >= 60:
-            quality = "우수"
-        elif score >= 40:
-            quality = "보통"
-        else:
-            quality = "미흡"
+        quality = _QUALITY_LABELS[bisect.bisect_right(_QUALITY_EDGES, score)]
 
         recommendation = f"{provider} 응답은 {quality}한 품질입니다."
 
@@ -27,7 +27,7 @@ Version: 1.0.0
 
 import asyncio
 import logging
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
@@ -168,6 +168,9 @@ class MultiLLMOrchestrator:
         self.providers: Dict[str, LLMProvider] = {}
         self._initialize_providers()
 
+        # 첫 generate() 호출 시 한 번만 연결 예열
+        self._prewarmed = False
+
         self.logger.info(
             f"MultiLLMOrchestrator 초기화 완료: "
             f"{len(self.providers)}개 제공자 활성화"
@@ -248,55 +251,152 @@ class MultiLLMOrchestrator:
         if not self.providers:
             raise RuntimeError("활성화된 LLM 제공자가 없습니다")
 
+        if not self._prewarmed:
+            self._prewarmed = True
+            await self.prewarm()
+
         self.logger.info(
             f"병렬 생성 시작: {len(self.providers)}개 제공자"
         )
 
-        # 1. 모든 제공자에 병렬 요청
-        tasks = [
-            self._call_provider(name, provider, prompt, context, system_prompt)
-            for name, provider in self.providers.items()
-        ]
+        if self.config.strategy == SelectionStrategy.FASTEST:
+            # 가장 빠른 응답만 필요하므로 나머지를 기다리거나 평가하지 않음
+            return await self._generate_fastest(
+                prompt, context, system_prompt, start_time
+            )
 
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
+        # 1. 모든 제공자에 병렬 요청하고, 도착한 응답부터 바로 평가
+        #    (제공자별 타임아웃은 _call_provider에서 적용)
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(
+                    self._call_and_evaluate(
+                        name, provider, prompt, context, system_prompt
+                    )
+                )
+                for name, provider in self.providers.items()
+            ]
 
-        # 예외를 LLMResponse로 변환
+        # 2. 결과 수집 (응답은 제공자 순서 유지, 평가는 점수순 정렬)
         processed_responses = []
-        for i, response in enumerate(responses):
-            provider_name = list(self.providers.keys())[i]
+        evaluation_results = []
+        for task in tasks:
+            response, evaluation = task.result()
+            processed_responses.append(response)
+            evaluation_results.append(evaluation)
 
-            if isinstance(response, Exception):
-                self.logger.error(
-                    f"{provider_name} 예외 발생: {str(response)}"
-                )
-                processed_responses.append(LLMResponse(
-                    provider=provider_name,
-                    content="",
-                    model="",
-                    latency=0,
-                    success=False,
-                    error=str(response)
-                ))
-            else:
-                processed_responses.append(response)
-
-        # 2. 응답 평가
-        evaluation_results = self.evaluator.evaluate_all(
-            processed_responses, prompt, context
-        )
+        evaluation_results.sort(key=lambda x: x.total_score, reverse=True)
 
-        # 3. 전략에 따라 최적 응답 선택
+        # 3. 전략에 따라 최적 응답 선택 (제공자별 응답 색인은 한 번만 생성)
+        responses_by_provider = {r.provider: r for r in processed_responses}
         selected = self._select_response(
             processed_responses,
-            evaluation_results
+            evaluation_results,
+            responses_by_provider
         )
 
+        return self._build_result(
+            processed_responses, evaluation_results, selected, start_time
+        )
+
+    async def _generate_fastest(
+        self,
+        prompt: str,
+        context: Optional[str],
+        system_prompt: Optional[str],
+        start_time: float
+    ) -> OrchestratorResult:
+        """
+        FASTEST 전략 생성
+
+        첫 번째 성공 응답이 도착하면 남은 요청을 취소하고 평가 없이 반환합니다.
+        먼저 끝난 응답이 실패면 다음 응답을 기다립니다.
+
+        Args:
+            prompt: 사용자 프롬프트
+            context: RAG 검색 결과 컨텍스트
+            system_prompt: 시스템 프롬프트
+            start_time: 생성 시작 시각 (이벤트 루프 시간)
+
+        Returns:
+            OrchestratorResult: 실행 결과
+        """
+        tasks = {
+            asyncio.create_task(
+                self._call_provider(name, provider, prompt, context, system_prompt)
+            ): name
+            for name, provider in self.providers.items()
+        }
+
+        responses: Dict[str, LLMResponse] = {}
+        selected: Optional[LLMResponse] = None
+        pending = set(tasks)
+
+        try:
+            while pending and selected is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    response = task.result()
+                    responses[tasks[task]] = response
+                    if response.success and (
+                        selected is None or response.latency < selected.latency
+                    ):
+                        selected = response
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        # 취소된 제공자도 결과 목록에 실패로 기록 (제공자 순서 유지)
+        all_responses = [
+            responses.get(name) or LLMResponse(
+                provider=name,
+                content="",
+                model=provider.config.model,
+                latency=0,
+                success=False,
+                error="더 빠른 응답이 선택되어 취소됨"
+            )
+            for name, provider in self.providers.items()
+        ]
+
+        if selected is None:
+            self.logger.warning("성공한 응답이 없습니다")
+        else:
+            self.logger.info(
+                f"가장 빠른 응답 선택: {selected.provider} "
+                f"({selected.latency:.2f}s)"
+            )
+
+        return self._build_result(all_responses, [], selected, start_time)
+
+    def _build_result(
+        self,
+        responses: List[LLMResponse],
+        evaluation_results: List[EvaluationResult],
+        selected: Optional[LLMResponse],
+        start_time: float
+    ) -> OrchestratorResult:
+        """
+        오케스트레이터 실행 결과 구성
+
+        Args:
+            responses: 모든 응답
+            evaluation_results: 평가 결과
+            selected: 선택된 응답
+            start_time: 생성 시작 시각 (이벤트 루프 시간)
+
+        Returns:
+            OrchestratorResult: 실행 결과
+        """
         total_latency = asyncio.get_event_loop().time() - start_time
 
         # 결과 구성
         result = OrchestratorResult(
             best_response=selected.content if selected else "응답을 생성할 수 없습니다.",
-            all_responses=processed_responses,
+            all_responses=responses,
             evaluation_results=evaluation_results,
             selected_provider=selected.provider if selected else "none",
             total_latency=total_latency,
@@ -305,7 +405,7 @@ class MultiLLMOrchestrator:
                 "timestamp": datetime.now().isoformat(),
                 "providers_called": list(self.providers.keys()),
                 "successful_responses": sum(
-                    1 for r in processed_responses if r.success
+                    1 for r in responses if r.success
                 ),
                 "evaluation_scores": {
                     r.provider: r.total_score for r in evaluation_results
@@ -320,6 +420,38 @@ class MultiLLMOrchestrator:
 
         return result
 
+    async def _call_and_evaluate(
+        self,
+        name: str,
+        provider: LLMProvider,
+        prompt: str,
+        context: Optional[str],
+        system_prompt: Optional[str]
+    ) -> Tuple[LLMResponse, EvaluationResult]:
+        """
+        단일 제공자 호출 후 즉시 평가
+
+        먼저 도착한 응답의 채점이 느린 제공자의 네트워크 대기와 겹치도록
+        호출과 평가를 하나의 작업으로 묶습니다.
+
+        Args:
+            name: 제공자 이름
+            provider: 제공자 인스턴스
+            prompt: 프롬프트
+            context: 컨텍스트
+            system_prompt: 시스템 프롬프트
+
+        Returns:
+            Tuple[LLMResponse, EvaluationResult]: 응답과 평가 결과
+        """
+        response = await self._call_provider(
+            name, provider, prompt, context, system_prompt
+        )
+        evaluation = await self.evaluator.evaluate_one_async(
+            response, prompt, context
+        )
+        return response, evaluation
+
     async def _call_provider(
         self,
         name: str,
@@ -331,6 +463,9 @@ class MultiLLMOrchestrator:
         """
         단일 제공자 호출
 
+        설정된 타임아웃을 넘기면 느린 제공자가 전체 배치를 붙잡지 않도록
+        호출을 취소하고 실패 응답을 반환합니다.
+
         Args:
             name: 제공자 이름
             provider: 제공자 인스턴스
@@ -343,12 +478,26 @@ class MultiLLMOrchestrator:
         """
         try:
             self.logger.debug(f"{name} 호출 시작")
-            response = await provider.generate(prompt, context, system_prompt)
+            async with asyncio.timeout(self.config.timeout):
+                response = await provider.generate(
+                    prompt, context, system_prompt
+                )
             self.logger.debug(
                 f"{name} 호출 완료: {response.latency:.2f}s"
             )
             return response
 
+        except TimeoutError:
+            self.logger.error(f"{name} 호출 타임아웃: {self.config.timeout}s 초과")
+            return LLMResponse(
+                provider=name,
+                content="",
+                model=provider.config.model,
+                latency=self.config.timeout,
+                success=False,
+                error="timeout"
+            )
+
         except Exception as e:
             self.logger.error(f"{name} 호출 실패: {str(e)}")
             return LLMResponse(
@@ -363,7 +512,8 @@ class MultiLLMOrchestrator:
     def _select_response(
         self,
         responses: List[LLMResponse],
-        evaluations: List[EvaluationResult]
+        evaluations: List[EvaluationResult],
+        responses_by_provider: Optional[Dict[str, LLMResponse]] = None
     ) -> Optional[LLMResponse]:
         """
         전략에 따라 최적의 응답을 선택합니다.
@@ -371,6 +521,7 @@ class MultiLLMOrchestrator:
         Args:
             responses: 모든 응답
             evaluations: 평가 결과
+            responses_by_provider: 제공자명 -> 응답 색인 (없으면 생성)
 
         Returns:
             Optional[LLMResponse]: 선택된 응답
@@ -382,6 +533,9 @@ class MultiLLMOrchestrator:
             self.logger.warning("성공한 응답이 없습니다")
             return None
 
+        if responses_by_provider is None:
+            responses_by_provider = {r.provider: r for r in responses}
+
         # 전략별 선택
         if self.config.strategy == SelectionStrategy.FASTEST:
             # 가장 빠른 응답 선택
@@ -397,12 +551,9 @@ class MultiLLMOrchestrator:
             consensus = self.evaluator.get_consensus(evaluations, threshold=60)
 
             if consensus:
-                # 합의된 응답 중 가장 높은 점수
+                # 합의된 응답 중 가장 높은 점수 (실패 응답은 0점이므로 항상 성공 응답)
                 best_eval = consensus[0]
-                selected = next(
-                    r for r in successful
-                    if r.provider == best_eval.provider
-                )
+                selected = responses_by_provider[best_eval.provider]
                 self.logger.info(
                     f"합의 응답 선택: {selected.provider} "
                     f"(점수: {best_eval.total_score})"
@@ -415,10 +566,9 @@ class MultiLLMOrchestrator:
         # BEST_QUALITY (기본값)
         if evaluations:
             best_eval = evaluations[0]
-            selected = next(
-                (r for r in successful if r.provider == best_eval.provider),
-                successful[0]
-            )
+            selected = responses_by_provider.get(best_eval.provider)
+            if selected is None or not selected.success:
+                selected = successful[0]
             self.logger.info(
                 f"최고 품질 응답 선택: {selected.provider} "
                 f"(점수: {best_eval.total_score})"
@@ -428,13 +578,31 @@ class MultiLLMOrchestrator:
         # 평가 없이 첫 번째 성공 응답 반환
         return successful[0]
 
+    async def prewarm(self) -> Dict[str, bool]:
+        """
+        모든 제공자의 HTTPS 연결 예열
+
+        첫 generate() 호출 시 자동으로 한 번 실행됩니다. 애플리케이션 시작 시
+        직접 호출하면 첫 요청도 TCP/TLS 핸드셰이크 없이 예열된 연결을 재사용합니다.
+
+        Returns:
+            Dict[str, bool]: 제공자별 예열 성공 여부
+        """
+        results = await asyncio.gather(
+            *(provider.prewarm() for provider in self.providers.values())
+        )
+        return dict(zip(self.providers, results))
+
     async def close(self):
         """
         모든 리소스 정리
+
+        공유 HTTP 연결 풀은 다음 요청에서 재사용하도록 유지합니다.
+        (프로세스 종료 시 providers.shutdown_sessions()로 정리)
         """
         for provider in self.providers.values():
             await provider.close()
-        self.logger.info("모든 제공자 연결 종료")
+        self.logger.info("모든 제공자 정리 완료")
 
     def get_provider_status(self) -> Dict[str, bool]:
         """
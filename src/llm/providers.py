@@ -20,11 +20,14 @@ Version: 1.0.0
 
 import asyncio
 import aiohttp
+import hashlib
+import json
 import logging
 import time
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
 
@@ -43,12 +46,15 @@ class ProviderConfig:
         temperature (float): 생성 온도 (0.0 ~ 1.0)
         max_tokens (int): 최대 토큰 수
         timeout (int): 요청 타임아웃 (초)
+        cache_responses (bool): 온도와 관계없이 응답 캐시 사용 여부
+            (온도가 0에 가까우면 항상 캐시)
     """
     api_key: str
     model: str
     temperature: float = 0.7
     max_tokens: int = 2000
     timeout: int = 30
+    cache_responses: bool = False
 
 
 @dataclass
@@ -76,6 +82,131 @@ class LLMResponse:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+# =============================================================================
+# 응답 캐시
+# =============================================================================
+
+class _ResponseCache:
+    """
+    LRU + TTL 응답 캐시 (private)
+
+    같은 요청(제공자, 모델, 생성 설정, 메시지)에 대한 성공 응답을 보관하여
+    반복 질문에서 API 왕복을 생략합니다.
+
+    Attributes:
+        max_entries (int): 최대 항목 수 (초과 시 가장 오래 안 쓴 항목 제거)
+        ttl (float): 항목 유효 시간 (초)
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl: float = 3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, LLMResponse]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """
+        캐시 조회 (만료된 항목은 제거)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Optional[LLMResponse]: 저장된 응답 (없거나 만료되면 None)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, response = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """
+        캐시 저장
+
+        Args:
+            key: 캐시 키
+            response: 저장할 응답
+        """
+        self._entries[key] = (time.monotonic(), response)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """모든 항목 삭제"""
+        self._entries.clear()
+
+
+# 모든 제공자가 공유하는 응답 캐시 (키에 제공자 이름이 포함됨)
+_response_cache = _ResponseCache()
+
+
+# =============================================================================
+# 공유 HTTP 세션
+# =============================================================================
+
+# 모든 제공자가 함께 쓰는 세션 (keep-alive 연결을 재사용하여 매 요청의 TCP/TLS 핸드셰이크 제거)
+# aiohttp 세션은 생성된 이벤트 루프에 묶이므로 루프도 함께 기록
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# 현재 공유 세션에서 이미 예열한 URL (세션 종료 시 초기화)
+_prewarmed_urls: set = set()
+
+
+async def _get_shared_session() -> aiohttp.ClientSession:
+    """
+    공유 HTTP 세션 가져오기 (지연 초기화, private)
+
+    현재 이벤트 루프에 열린 세션이 없으면 연결 풀을 크게 잡은 커넥터로 새로 만듭니다.
+    이전 루프에서 만든 세션이 남아 있으면 먼저 닫아 연결이 새지 않도록 합니다.
+    타임아웃은 제공자마다 다르므로 요청 단위로 지정합니다.
+
+    Returns:
+        aiohttp.ClientSession: 공유 HTTP 세션
+    """
+    global _shared_session, _shared_session_loop
+
+    loop = asyncio.get_running_loop()
+    if _shared_session is not None and _shared_session_loop is not loop:
+        await shutdown_sessions()
+
+    if _shared_session is None or _shared_session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=512,  # 전체 최대 동시 연결 수
+            limit_per_host=128,  # 제공자(호스트)별 최대 동시 연결 수
+            ttl_dns_cache=300,  # DNS 조회 결과 캐시 (초)
+            keepalive_timeout=75  # 유휴 연결 유지 시간 (초)
+        )
+        _shared_session = aiohttp.ClientSession(connector=connector)
+        _shared_session_loop = loop
+
+    return _shared_session
+
+
+async def shutdown_sessions() -> None:
+    """
+    공유 HTTP 세션 종료
+
+    프로세스 종료 시 한 번 호출합니다. 개별 제공자의 close()는
+    다른 제공자가 쓰는 연결 풀을 닫지 않습니다.
+    """
+    global _shared_session, _shared_session_loop
+
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
+    _shared_session_loop = None
+    _prewarmed_urls.clear()
+
+
 # =============================================================================
 # 추상 기본 클래스
 # =============================================================================
@@ -103,7 +234,12 @@ class LLMProvider(ABC):
         """
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
-        self._session: Optional[aiohttp.ClientSession] = None
+        # 공유 세션을 쓰므로 타임아웃은 요청마다 지정
+        self._timeout = aiohttp.ClientTimeout(
+            total=config.timeout,
+            connect=5,
+            sock_read=config.timeout
+        )
 
     @property
     @abstractmethod
@@ -133,20 +269,129 @@ class LLMProvider(ABC):
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """
-        HTTP 세션 가져오기 (지연 초기화)
+        HTTP 세션 가져오기 (모든 제공자가 공유하는 세션)
 
         Returns:
             aiohttp.ClientSession: HTTP 클라이언트 세션
         """
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-            self._session = aiohttp.ClientSession(timeout=timeout)
-        return self._session
+        return await _get_shared_session()
+
+    @property
+    def prewarm_url(self) -> str:
+        """연결 예열 대상 URL (제공자 API 엔드포인트)"""
+        return self.API_URL
+
+    async def prewarm(self) -> bool:
+        """
+        HTTPS 연결 예열
+
+        가벼운 HEAD 요청으로 공유 연결 풀에 keep-alive 연결을 미리 열어 두어,
+        첫 실제 요청이 TCP/TLS 핸드셰이크를 건너뛰도록 합니다.
+        응답 상태는 무시하며 실패해도 예외를 던지지 않습니다.
+        현재 공유 세션에서 이미 예열한 URL은 다시 요청하지 않습니다.
+
+        Returns:
+            bool: 연결 성공 여부
+        """
+        try:
+            session = await self._get_session()
+            if self.prewarm_url in _prewarmed_urls:
+                return True
+
+            async with session.head(
+                self.prewarm_url,
+                allow_redirects=False,
+                timeout=self._timeout
+            ):
+                pass
+            _prewarmed_urls.add(self.prewarm_url)
+            self.logger.debug(f"{self.provider_name} 연결 예열 완료")
+            return True
+
+        except Exception as e:
+            self.logger.warning(f"{self.provider_name} 연결 예열 실패: {str(e)}")
+            return False
 
     async def close(self):
-        """리소스 정리"""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """
+        리소스 정리
+
+        세션은 제공자 간에 공유되므로 여기서 닫지 않습니다.
+        프로세스 종료 시 shutdown_sessions()로 정리합니다.
+        """
+
+    # =========================================================================
+    # 응답 캐시
+    # =========================================================================
+
+    @property
+    def _cache_enabled(self) -> bool:
+        """결정적 생성(온도≈0)이거나 명시적으로 켠 경우에만 캐시 사용"""
+        return self.config.temperature <= 0.01 or self.config.cache_responses
+
+    def _cache_key(self, request: Any) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            request: 요청 본문 (메시지 목록 등 JSON 직렬화 가능한 값)
+
+        Returns:
+            str: SHA-256 16진수 키
+        """
+        raw = json.dumps(
+            {
+                "p": self.provider_name,
+                "m": self.config.model,
+                "t": self.config.temperature,
+                "n": self.config.max_tokens,
+                "msgs": request
+            },
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _get_cached(self, key: str, start_time: float) -> Optional[LLMResponse]:
+        """
+        캐시된 응답 조회
+
+        Args:
+            key: 캐시 키
+            start_time: 요청 시작 시각
+
+        Returns:
+            Optional[LLMResponse]: 캐시 적중 시 응답 사본 (지연 시간은 이번 조회 기준)
+        """
+        cached = _response_cache.get(key)
+        if cached is None:
+            return None
+
+        self.logger.debug(f"{self.provider_name} 캐시 적중")
+        return replace(
+            cached,
+            latency=time.time() - start_time,
+            metadata={**cached.metadata, "cached": True}
+        )
+
+    def _store_cached(
+        self,
+        key: Optional[str],
+        response: LLMResponse
+    ) -> LLMResponse:
+        """
+        성공 응답을 캐시에 저장
+
+        Args:
+            key: 캐시 키 (None이면 캐시 미사용)
+            response: 응답
+
+        Returns:
+            LLMResponse: 전달받은 응답 (그대로 반환)
+        """
+        if key is not None and response.success:
+            _response_cache.put(key, response)
+        return response
 
     def _build_messages(
         self,
@@ -243,6 +488,13 @@ class OpenAIProvider(LLMProvider):
             # 요청 데이터 구성
             messages = self._build_messages(prompt, context, system_prompt)
 
+            # 캐시 조회 (결정적 생성일 때만)
+            cache_key = self._cache_key(messages) if self._cache_enabled else None
+            if cache_key is not None:
+                cached = self._get_cached(cache_key, start_time)
+                if cached is not None:
+                    return cached
+
             payload = {
                 "model": self.config.model,
                 "messages": messages,
@@ -259,7 +511,8 @@ class OpenAIProvider(LLMProvider):
             async with session.post(
                 self.API_URL,
                 json=payload,
-                headers=headers
+                headers=headers,
+                timeout=self._timeout
             ) as response:
 
                 latency = time.time() - start_time
@@ -286,7 +539,7 @@ class OpenAIProvider(LLMProvider):
                     f"OpenAI 응답 완료: {tokens_used} tokens, {latency:.2f}s"
                 )
 
-                return LLMResponse(
+                return self._store_cached(cache_key, LLMResponse(
                     provider=self.provider_name,
                     content=content,
                     model=self.config.model,
@@ -298,7 +551,7 @@ class OpenAIProvider(LLMProvider):
                         "prompt_tokens": data.get("usage", {}).get("prompt_tokens", 0),
                         "completion_tokens": data.get("usage", {}).get("completion_tokens", 0)
                     }
-                )
+                ))
 
         except asyncio.TimeoutError:
             latency = time.time() - start_time
@@ -381,6 +634,13 @@ class GroqProvider(LLMProvider):
             # 요청 데이터 구성 (OpenAI 호환 형식)
             messages = self._build_messages(prompt, context, system_prompt)
 
+            # 캐시 조회 (결정적 생성일 때만)
+            cache_key = self._cache_key(messages) if self._cache_enabled else None
+            if cache_key is not None:
+                cached = self._get_cached(cache_key, start_time)
+                if cached is not None:
+                    return cached
+
             payload = {
                 "model": self.config.model,
                 "messages": messages,
@@ -397,7 +657,8 @@ class GroqProvider(LLMProvider):
             async with session.post(
                 self.API_URL,
                 json=payload,
-                headers=headers
+                headers=headers,
+                timeout=self._timeout
             ) as response:
 
                 latency = time.time() - start_time
@@ -424,7 +685,7 @@ class GroqProvider(LLMProvider):
                     f"Groq 응답 완료: {tokens_used} tokens, {latency:.2f}s"
                 )
 
-                return LLMResponse(
+                return self._store_cached(cache_key, LLMResponse(
                     provider=self.provider_name,
                     content=content,
                     model=self.config.model,
@@ -438,7 +699,7 @@ class GroqProvider(LLMProvider):
                         # Groq 특유의 메타데이터
                         "x_groq": data.get("x_groq", {})
                     }
-                )
+                ))
 
         except asyncio.TimeoutError:
             latency = time.time() - start_time
@@ -495,6 +756,10 @@ class GeminiProvider(LLMProvider):
     def provider_name(self) -> str:
         return "gemini"
 
+    @property
+    def prewarm_url(self) -> str:
+        return self.API_BASE
+
     async def generate(
         self,
         prompt: str,
@@ -569,11 +834,21 @@ class GeminiProvider(LLMProvider):
                 ]
             }
 
+            # 캐시 조회 (결정적 생성일 때만)
+            cache_key = (
+                self._cache_key(payload["contents"]) if self._cache_enabled else None
+            )
+            if cache_key is not None:
+                cached = self._get_cached(cache_key, start_time)
+                if cached is not None:
+                    return cached
+
             # API 호출
             async with session.post(
                 url,
                 json=payload,
-                params={"key": self.config.api_key}
+                params={"key": self.config.api_key},
+                timeout=self._timeout
             ) as response:
 
                 latency = time.time() - start_time
@@ -617,7 +892,7 @@ class GeminiProvider(LLMProvider):
                     f"Gemini 응답 완료: {tokens_used} tokens, {latency:.2f}s"
                 )
 
-                return LLMResponse(
+                return self._store_cached(cache_key, LLMResponse(
                     provider=self.provider_name,
                     content=content,
                     model=self.config.model,
@@ -630,7 +905,7 @@ class GeminiProvider(LLMProvider):
                         "completion_tokens": usage_metadata.get("candidatesTokenCount", 0),
                         "safety_ratings": candidates[0].get("safetyRatings", [])
                     }
-                )
+                ))
 
         except asyncio.TimeoutError:
             latency = time.time() - start_time
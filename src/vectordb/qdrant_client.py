@@ -279,9 +279,17 @@ class QdrantVectorDB:
             if points:
                 url = f"{self.config.url}/collections/{self.config.collection_name}/points"
 
-                async with self._session.put(url, json={"points": points}) as resp:
-                    if resp.status in [200, 201]:
-                        success_count += len(points)
+                # 배치마다 따로 처리하여 뒤 배치가 실패해도 앞서 적재된 건수를 유지
+                try:
+                    async with self._session.put(url, json={"points": points}) as resp:
+                        if resp.status in [200, 201]:
+                            success_count += len(points)
+                        else:
+                            self._logger.error(
+                                f"배치 적재 실패 ({i}~{i + len(batch)}): HTTP {resp.status}"
+                            )
+                except Exception as e:
+                    self._logger.error(f"배치 적재 실패 ({i}~{i + len(batch)}): {e}")
 
             self._logger.info(f"배치 처리: {i + len(batch)}/{len(documents)}")
 
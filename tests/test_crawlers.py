@@ -15,7 +15,7 @@ Version: 1.0.0
 import pytest
 import asyncio
 from unittest.mock import AsyncMock, patch, MagicMock
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import sys
 sys.path.insert(0, '/home/user/test')
@@ -31,6 +31,8 @@ from src.crawlers.base_crawler import (
 from src.crawlers.kinfa_crawler import KinfaCrawler
 from src.crawlers.bokjiro_crawler import BokjiroCrawler
 from src.crawlers.factory import PolicyCrawlerFactory
+from src.crawlers import scheduler as scheduler_module
+from src.crawlers.scheduler import CrawlerScheduler
 
 
 # =============================================================================
@@ -177,6 +179,18 @@ class TestKinfaCrawler:
         assert age_min == 19
         assert age_max == 34
 
+        # 상한만 있는 경우
+        age_min, age_max = kinfa_crawler._extract_age_range("만 39세 이하 청년")
+        assert age_min == 19
+        assert age_max == 39
+
+        # 상한과 범위가 함께 있으면 범위 우선
+        age_min, age_max = kinfa_crawler._extract_age_range(
+            "만 39세 이하 청년 (우대: 20~30세)"
+        )
+        assert age_min == 20
+        assert age_max == 30
+
         # 기본값
         age_min, age_max = kinfa_crawler._extract_age_range("나이 정보 없음")
         assert age_min == 19
@@ -193,6 +207,25 @@ class TestKinfaCrawler:
         income = kinfa_crawler._extract_income_limit(text)
         assert income == 50000000
 
+    def test_extract_dates(self, kinfa_crawler):
+        """신청 기간 추출 테스트 (존재하지 않는 날짜 제외)"""
+        soup = kinfa_crawler._parse_html(
+            "<p>2025.13.40 공고, 신청기간 2025.01.01 ~ 2025년 12월 31일</p>"
+        )
+        start_date, end_date = kinfa_crawler._extract_dates(soup)
+        assert start_date == "2025-01-01"
+        assert end_date == "2025-12-31"
+
+    def test_extract_keywords(self, kinfa_crawler):
+        """키워드 추출 테스트 (순서 유지, 중복 제거)"""
+        keywords = kinfa_crawler._extract_keywords(
+            "청년 전용 대환대출",
+            "청년 전용 대환대출 저금리 전환"
+        )
+        assert keywords == [
+            "청년", "서민금융", "전용", "대환대출", "대출", "대환", "저금리"
+        ]
+
     @pytest.mark.asyncio
     async def test_parse_policy(self, kinfa_crawler, sample_policy_html):
         """정책 파싱 테스트"""
@@ -267,6 +300,202 @@ class TestPolicyCrawlerFactory:
         assert len(crawlers) >= 2
 
 
+# =============================================================================
+# 스케줄러 테스트
+# =============================================================================
+
+@pytest.fixture
+def shifted_clock(monkeypatch):
+    """
+    매분 정각 0.1초 전에서 시작해 실제 시간만큼 흐르는 가짜 시계
+
+    '* * * * *' 작업은 약 0.1초 뒤에, '*/5 * * * *' 작업은 테스트 중에
+    실행되지 않습니다.
+    """
+    offset = datetime(2025, 1, 1, 10, 0, 59, 900000) - datetime.now()
+
+    class ShiftedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + offset
+
+    monkeypatch.setattr(scheduler_module, "datetime", ShiftedDatetime)
+    return ShiftedDatetime
+
+
+class TestCrawlerScheduler:
+    """CrawlerScheduler 테스트"""
+
+    @staticmethod
+    def _recording_execute(ran, expected, delay=0.0, active=None):
+        """실행한 작업 ID를 기록하는 가짜 _execute_job (expected개 실행 시 이벤트 설정)"""
+        done = asyncio.Event()
+
+        async def execute(job):
+            if active is not None:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            await asyncio.sleep(delay)
+            if active is not None:
+                active["now"] -= 1
+            ran.append(job.job_id)
+            if len(ran) >= expected:
+                done.set()
+            return None
+
+        return execute, done
+
+    def test_add_job_sets_next_run(self):
+        """작업 등록 시 다음 실행 시각 계산"""
+        scheduler = CrawlerScheduler()
+        job_id = scheduler.add_job("kinfa", "0 6 * * *")
+
+        next_run = scheduler.get_job_status(job_id).next_run
+        assert next_run > datetime.now()
+        assert (next_run.hour, next_run.minute) == (6, 0)
+
+    def test_add_job_invalid_cron(self):
+        """잘못된 Cron 표현식 거부"""
+        scheduler = CrawlerScheduler()
+
+        with pytest.raises(ValueError):
+            scheduler.add_job("kinfa", "매일 6시")
+
+    @pytest.mark.asyncio
+    async def test_run_all_now_feeds_pipeline(self):
+        """즉시 실행 결과를 파이프라인으로 일괄 전달"""
+        pipeline = MagicMock()
+        pipeline.execute_many = AsyncMock(return_value=[])
+        scheduler = CrawlerScheduler(pipeline=pipeline)
+        scheduler.add_job("kinfa", "0 6 * * *", job_id="morning")
+        scheduler.add_job("kinfa", "0 18 * * *", job_id="evening")
+
+        results = {
+            "morning": CrawlResult(success=True, source_name="서민금융진흥원"),
+            "evening": CrawlResult(success=True, source_name="서민금융진흥원"),
+        }
+
+        async def fake_execute(job):
+            return results[job.job_id]
+
+        with patch.object(scheduler, "_execute_job", side_effect=fake_execute):
+            assert await scheduler.run_all_now() == results
+
+        pipeline.execute_many.assert_awaited_once_with(list(results.values()), 4)
+
+    @pytest.mark.asyncio
+    async def test_callback_error_does_not_stop_others(self):
+        """콜백 하나가 예외를 던져도 나머지 동기/비동기 콜백은 모두 호출"""
+        scheduler = CrawlerScheduler()
+        scheduler.add_job("kinfa", "0 6 * * *", job_id="morning")
+        result = CrawlResult(success=True, source_name="서민금융진흥원")
+        calls = []
+
+        def failing_sync(value):
+            raise RuntimeError("동기 콜백 실패")
+
+        async def failing_async(value):
+            raise RuntimeError("비동기 콜백 실패")
+
+        def recording_sync(value):
+            calls.append(("sync", value))
+
+        async def recording_async(value):
+            calls.append(("async", value))
+
+        for callback in (failing_sync, failing_async, recording_sync, recording_async):
+            scheduler.on_start(callback)
+            scheduler.on_complete(callback)
+
+        crawler = MagicMock()
+        crawler.crawl = AsyncMock(return_value=result)
+        with patch.object(PolicyCrawlerFactory, "create", return_value=crawler):
+            assert await scheduler.run_now("morning") is result
+
+        # 시작/완료 콜백 모두 예외와 무관하게 동기·비동기 콜백이 호출됨
+        assert len(calls) == 4
+        for expected in [("sync", "morning"), ("async", "morning"),
+                         ("sync", result), ("async", result)]:
+            assert expected in calls
+        assert scheduler.get_job_status("morning").success_count == 1
+
+    @pytest.mark.asyncio
+    async def test_due_jobs_respect_concurrency_limit(self, shifted_clock):
+        """같은 시각에 실행될 작업도 max_concurrent_jobs까지만 동시에 실행"""
+        scheduler = CrawlerScheduler(max_concurrent_jobs=2)
+        for i in range(5):
+            scheduler.add_job("kinfa", "* * * * *", job_id=f"job-{i}")
+
+        ran, active = [], {"now": 0, "max": 0}
+        execute, done = self._recording_execute(ran, 5, delay=0.05, active=active)
+
+        with patch.object(scheduler, "_execute_job", side_effect=execute):
+            await scheduler.start()
+            try:
+                await asyncio.wait_for(done.wait(), timeout=2)
+            finally:
+                await scheduler.stop()
+
+        assert sorted(ran) == [f"job-{i}" for i in range(5)]
+        assert active["max"] == 2
+
+    @pytest.mark.asyncio
+    async def test_added_job_wakes_loop_and_runs_earliest(self, shifted_clock):
+        """대기 중인 루프가 작업 추가로 깨어나 가장 이른 작업만 실행"""
+        scheduler = CrawlerScheduler()
+        ran = []
+        execute, done = self._recording_execute(ran, 1)
+
+        with patch.object(scheduler, "_execute_job", side_effect=execute):
+            await scheduler.start()
+            try:
+                # 작업이 없으므로 루프는 무기한 대기 중
+                await asyncio.sleep(0.01)
+                scheduler.add_job("kinfa", "*/5 * * * *", job_id="every5")
+                scheduler.add_job("kinfa", "* * * * *", job_id="every1")
+
+                await asyncio.wait_for(done.wait(), timeout=2)
+                await asyncio.sleep(0.05)
+            finally:
+                await scheduler.stop()
+
+        assert ran == ["every1"]
+        every1 = scheduler.get_job_status("every1")
+        every5 = scheduler.get_job_status("every5")
+        assert every1.next_run == datetime(2025, 1, 1, 10, 2)
+        assert every5.next_run == datetime(2025, 1, 1, 10, 5)
+        assert scheduler._heap[0] == (every1.next_run, "every1")
+
+    @pytest.mark.asyncio
+    async def test_removed_and_disabled_jobs_are_skipped(self, shifted_clock):
+        """제거/비활성화된 작업의 힙 항목은 실행하지 않고 버림"""
+        scheduler = CrawlerScheduler()
+        for job_id in ("kept", "removed", "disabled"):
+            scheduler.add_job("kinfa", "* * * * *", job_id=job_id)
+        scheduler.remove_job("removed")
+        scheduler.disable_job("disabled")
+
+        ran = []
+        execute, done = self._recording_execute(ran, 1)
+
+        with patch.object(scheduler, "_execute_job", side_effect=execute):
+            await scheduler.start()
+            try:
+                await asyncio.wait_for(done.wait(), timeout=2)
+                await asyncio.sleep(0.05)
+                assert ran == ["kept"]
+                assert scheduler._heap == [
+                    (scheduler.get_job_status("kept").next_run, "kept")
+                ]
+
+                # 마지막 작업을 제거하면 루프가 깨어나 남은 항목을 정리
+                scheduler.remove_job("kept")
+                await asyncio.sleep(0.01)
+                assert scheduler._heap == []
+            finally:
+                await scheduler.stop()
+
+
 # =============================================================================
 # CrawlResult 테스트
 # =============================================================================
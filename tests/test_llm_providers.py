@@ -25,10 +25,18 @@ from src.llm.providers import (
     GeminiProvider,
     ProviderConfig,
     ProviderFactory,
-    LLMResponse
+    LLMResponse,
+    _response_cache,
+    shutdown_sessions
 )
 from src.llm.evaluator import ResponseEvaluator, EvaluationCriteria
-from src.llm.multi_llm import MultiLLMOrchestrator, LLMConfig, SelectionStrategy
+from src.llm import providers as providers_module
+from src.llm.multi_llm import (
+    MultiLLMOrchestrator,
+    LLMConfig,
+    SelectionStrategy,
+    quick_generate
+)
 
 
 # =============================================================================
@@ -141,6 +149,39 @@ class TestOpenAIProvider:
             assert response.provider == "openai"
             assert response.tokens_used == 100
 
+    @pytest.mark.asyncio
+    async def test_generate_uses_cache_when_deterministic(self):
+        """온도 0이면 같은 요청은 캐시에서 응답"""
+        provider = OpenAIProvider(ProviderConfig(
+            api_key="test-openai-key",
+            model="gpt-4",
+            temperature=0.0
+        ))
+        _response_cache.clear()
+
+        mock_response = {
+            "choices": [{"message": {"content": "캐시 응답"}}],
+            "usage": {"total_tokens": 10}
+        }
+
+        with patch.object(provider, '_get_session') as mock_session:
+            mock_resp = AsyncMock()
+            mock_resp.status = 200
+            mock_resp.json = AsyncMock(return_value=mock_response)
+
+            mock_session.return_value.post = MagicMock(
+                return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_resp))
+            )
+
+            first = await provider.generate("같은 질문")
+            second = await provider.generate("같은 질문")
+
+            assert mock_session.return_value.post.call_count == 1
+            assert second.content == first.content
+            assert second.metadata["cached"] is True
+
+        _response_cache.clear()
+
     @pytest.mark.asyncio
     async def test_generate_with_context(self, openai_config):
         """컨텍스트와 함께 응답 생성 테스트"""
@@ -276,6 +317,12 @@ class TestMultiLLMOrchestrator:
             timeout=10
         )
 
+    @pytest.fixture(autouse=True)
+    def no_prewarm(self):
+        """generate() 테스트에서 실제 네트워크 예열 요청 차단"""
+        with patch.object(MultiLLMOrchestrator, "prewarm", AsyncMock(return_value={})):
+            yield
+
     def test_initialization(self, llm_config):
         """오케스트레이터 초기화 테스트"""
         orchestrator = MultiLLMOrchestrator(llm_config)
@@ -295,6 +342,84 @@ class TestMultiLLMOrchestrator:
         assert status["groq"] is True
         assert status["gemini"] is True
 
+    @staticmethod
+    def _fake_generate(provider_name, delay, success=True, events=None):
+        """지연 후 응답하는 가짜 generate (취소되면 events에 기록)"""
+        async def generate(prompt, context=None, system_prompt=None):
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                if events is not None:
+                    events.append(f"{provider_name} 취소")
+                raise
+            return LLMResponse(
+                provider=provider_name,
+                content=f"{provider_name} 응답" if success else "",
+                model="test-model",
+                latency=delay,
+                success=success,
+                error=None if success else "API 오류"
+            )
+        return generate
+
+    @pytest.mark.asyncio
+    async def test_fastest_cancels_remaining(self, llm_config):
+        """FASTEST: 첫 성공 응답이 오면 나머지를 취소하고 실패로 기록"""
+        llm_config.strategy = SelectionStrategy.FASTEST
+        orchestrator = MultiLLMOrchestrator(llm_config)
+        events = []
+        orchestrator.providers["openai"].generate = self._fake_generate(
+            "openai", 5, events=events
+        )
+        orchestrator.providers["groq"].generate = self._fake_generate("groq", 0.01)
+        orchestrator.providers["gemini"].generate = self._fake_generate(
+            "gemini", 5, events=events
+        )
+
+        result = await orchestrator.generate("청년 정책")
+
+        assert result.selected_provider == "groq"
+        assert result.total_latency < 1
+        assert sorted(events) == ["gemini 취소", "openai 취소"]
+        cancelled = {r.provider: r for r in result.all_responses if not r.success}
+        assert set(cancelled) == {"openai", "gemini"}
+        assert cancelled["openai"].error == "더 빠른 응답이 선택되어 취소됨"
+
+    @pytest.mark.asyncio
+    async def test_fastest_waits_after_leading_failure(self, llm_config):
+        """FASTEST: 먼저 끝난 응답이 실패면 다음 응답을 기다림"""
+        llm_config.strategy = SelectionStrategy.FASTEST
+        orchestrator = MultiLLMOrchestrator(llm_config)
+        orchestrator.providers["openai"].generate = self._fake_generate("openai", 5)
+        orchestrator.providers["groq"].generate = self._fake_generate("groq", 0.05)
+        orchestrator.providers["gemini"].generate = self._fake_generate(
+            "gemini", 0.01, success=False
+        )
+
+        result = await orchestrator.generate("청년 정책")
+
+        assert result.selected_provider == "groq"
+        gemini = next(r for r in result.all_responses if r.provider == "gemini")
+        assert gemini.error == "API 오류"
+
+    @pytest.mark.asyncio
+    async def test_timeout_does_not_cancel_siblings(self, llm_config):
+        """타임아웃된 제공자만 실패 처리하고 나머지 응답은 유지"""
+        llm_config.timeout = 0.1
+        orchestrator = MultiLLMOrchestrator(llm_config)
+        orchestrator.providers["openai"].generate = self._fake_generate("openai", 5)
+        orchestrator.providers["groq"].generate = self._fake_generate("groq", 0.01)
+        orchestrator.providers["gemini"].generate = self._fake_generate("gemini", 0.05)
+
+        result = await orchestrator.generate("청년 정책")
+
+        responses = {r.provider: r for r in result.all_responses}
+        assert responses["openai"].success is False
+        assert responses["openai"].error == "timeout"
+        assert responses["groq"].success is True
+        assert responses["gemini"].success is True
+        assert result.selected_provider in ("groq", "gemini")
+
     def test_missing_api_key(self):
         """API 키 누락 테스트"""
         config = LLMConfig(
@@ -309,6 +434,100 @@ class TestMultiLLMOrchestrator:
         assert "openai" in orchestrator.providers
 
 
+# =============================================================================
+# 공유 세션 수명 테스트
+# =============================================================================
+
+class TestSharedSession:
+    """제공자 간 공유 HTTP 세션 수명 테스트"""
+
+    def test_stale_session_closed_on_loop_change(self, openai_config):
+        """이벤트 루프가 바뀌면 이전 루프의 세션을 닫고 새로 생성"""
+        provider = OpenAIProvider(openai_config)
+
+        first = asyncio.run(provider._get_session())
+        assert not first.closed
+
+        async def reuse():
+            second = await provider._get_session()
+            try:
+                return first.closed, second is first
+            finally:
+                await shutdown_sessions()
+
+        first_closed, same = asyncio.run(reuse())
+        assert first_closed is True
+        assert same is False
+
+    async def test_quick_generate_reuses_session(self):
+        """quick_generate를 연달아 호출해도 같은 공유 세션(연결 풀)을 재사용"""
+        sessions = []
+
+        async def generate(self, prompt, context=None, system_prompt=None):
+            sessions.append(await self._get_session())
+            return LLMResponse(
+                provider=self.provider_name,
+                content=f"{self.provider_name} 응답",
+                model="test-model",
+                latency=0.0
+            )
+
+        try:
+            with patch.object(OpenAIProvider, "generate", generate), \
+                    patch.object(GroqProvider, "generate", generate), \
+                    patch.object(GeminiProvider, "generate", generate), \
+                    patch.object(MultiLLMOrchestrator, "prewarm", AsyncMock(return_value={})):
+                await quick_generate("청년 정책 추천", "sk", "gsk", "gm")
+                await quick_generate("청년 정책 추천", "sk", "gsk", "gm")
+
+            assert len(sessions) == 6
+            assert all(session is sessions[0] for session in sessions)
+            assert providers_module._shared_session is sessions[0]
+            assert not sessions[0].closed
+        finally:
+            await shutdown_sessions()
+
+        assert sessions[0].closed
+
+
+    async def test_generate_prewarms_once_per_provider(self):
+        """첫 generate()에서 제공자마다 한 번만 HEAD 예열 요청"""
+        session = MagicMock()
+
+        async def generate(self, prompt, context=None, system_prompt=None):
+            return LLMResponse(
+                provider=self.provider_name,
+                content=f"{self.provider_name} 응답",
+                model="test-model",
+                latency=0.0
+            )
+
+        config = LLMConfig(
+            openai_api_key="sk", groq_api_key="gsk", gemini_api_key="gm"
+        )
+        try:
+            with patch.object(providers_module, "_get_shared_session",
+                              AsyncMock(return_value=session)), \
+                    patch.object(OpenAIProvider, "generate", generate), \
+                    patch.object(GroqProvider, "generate", generate), \
+                    patch.object(GeminiProvider, "generate", generate):
+                orchestrator = MultiLLMOrchestrator(config)
+                await orchestrator.generate("청년 정책 추천")
+                await orchestrator.generate("청년 정책 추천")
+                # 새 오케스트레이터도 이미 예열된 연결은 다시 예열하지 않음
+                await MultiLLMOrchestrator(config).generate("청년 정책 추천")
+
+            assert session.head.call_count == 3
+            urls = {c.args[0] for c in session.head.call_args_list}
+            assert urls == {
+                p.prewarm_url for p in orchestrator.providers.values()
+            }
+            for c in session.head.call_args_list:
+                assert c.kwargs["allow_redirects"] is False
+        finally:
+            await shutdown_sessions()
+
+
 # =============================================================================
 # 실행
 # =============================================================================
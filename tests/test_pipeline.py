@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+=============================================================================
+데이터 파이프라인 테스트
+=============================================================================
+
+정제, 임베딩, Vector DB 삽입 단계와 파이프라인 실행을 테스트합니다.
+OpenAI 클라이언트와 Pinecone 인덱스는 가짜 객체로 대체합니다.
+
+Author: Youth Policy System Team
+Version: 1.0.0
+=============================================================================
+"""
+
+import pytest
+import sqlite3
+from types import SimpleNamespace
+
+import sys
+sys.path.insert(0, '/home/user/test')
+
+from src.crawlers import pipeline as pipeline_module
+from src.crawlers.base_crawler import CrawlResult, PolicyData, SourceTier
+from src.crawlers.pipeline import (
+    DataCleaningStep,
+    DataPipeline,
+    EmbeddingGenerationStep,
+    PipelineStep,
+    SQLiteEmbeddingCache,
+    VectorDBInsertionStep
+)
+
+
+# =============================================================================
+# 가짜 클라이언트
+# =============================================================================
+
+class FakeEmbeddings:
+    """AsyncOpenAI.embeddings 대체 (입력마다 결정적인 벡터 반환)"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def create(self, input, model):
+        self.calls.append(list(input))
+        return SimpleNamespace(data=[
+            SimpleNamespace(index=i, embedding=[float(len(text)), float(i), 1.0])
+            for i, text in enumerate(input)
+        ])
+
+
+class FakeOpenAI:
+    """AsyncOpenAI 대체"""
+
+    def __init__(self):
+        self.embeddings = FakeEmbeddings()
+
+    async def close(self):
+        pass
+
+
+class FakeAsyncResult:
+    """async_req 업서트 결과 대체"""
+
+    def __init__(self, index, size):
+        self._index = index
+        self._size = size
+
+    def get(self):
+        self._index.outstanding -= self._size
+
+
+class FakeIndex:
+    """Pinecone Index 대체 (동시에 대기 중인 벡터 수 기록)"""
+
+    def __init__(self):
+        self.batches = []
+        self.outstanding = 0
+        self.max_outstanding = 0
+
+    def upsert(self, vectors, async_req=False):
+        assert async_req is True
+        self.batches.append(vectors)
+        self.outstanding += len(vectors)
+        self.max_outstanding = max(self.max_outstanding, self.outstanding)
+        return FakeAsyncResult(self, len(vectors))
+
+    def close(self):
+        pass
+
+    @property
+    def upserted_ids(self):
+        return sorted(v["id"] for batch in self.batches for v in batch)
+
+
+class FailingIndex(FakeIndex):
+    """지정한 크기의 배치 업서트가 실패하는 Pinecone Index 대체"""
+
+    def __init__(self, fail_size):
+        super().__init__()
+        self._fail_size = fail_size
+
+    def upsert(self, vectors, async_req=False):
+        if len(vectors) == self._fail_size:
+            raise RuntimeError("업서트 실패")
+        return super().upsert(vectors, async_req)
+
+
+# =============================================================================
+# 픽스처
+# =============================================================================
+
+def make_crawl_result(contents):
+    """정책 내용 목록으로 크롤링 결과 생성"""
+    result = CrawlResult(
+        success=True,
+        source_name="서민금융진흥원",
+        source_tier=SourceTier.TIER_1
+    )
+    for i, content in enumerate(contents):
+        result.add_policy(PolicyData(
+            policy_id=f"policy-{i}",
+            policy_name=f"정책 {i}",
+            category="대출",
+            content=content
+        ))
+    return result
+
+
+@pytest.fixture
+def openai_client():
+    return FakeOpenAI()
+
+
+@pytest.fixture
+def index():
+    return FakeIndex()
+
+
+@pytest.fixture
+def cache():
+    cache = SQLiteEmbeddingCache(":memory:")
+    yield cache
+    cache.close()
+
+
+class ExcludeFilterStep(PipelineStep):
+    """process만 구현한 단계 ("제외"가 들어간 정책 제거)"""
+
+    async def process(self, context):
+        context.processed_policies = [
+            policy for policy in context.processed_policies
+            if "제외" not in policy["content"]
+        ]
+        return context
+
+
+def make_pipeline(openai_client, index, cache=None, extra_steps=()):
+    """가짜 클라이언트를 주입한 기본 구성 파이프라인"""
+    embedding_step = EmbeddingGenerationStep("test-key", cache=cache)
+    embedding_step._client = openai_client
+    embedding_step._count_tokens = len
+
+    insertion_step = VectorDBInsertionStep("test-key", "test-index")
+    insertion_step._index = index
+
+    pipeline = DataPipeline()
+    pipeline.add_step(DataCleaningStep())
+    for step in extra_steps:
+        pipeline.add_step(step)
+    pipeline.add_step(embedding_step)
+    pipeline.add_step(insertion_step)
+    return pipeline
+
+
+# =============================================================================
+# 파이프라인 실행 테스트
+# =============================================================================
+
+class TestDataPipeline:
+    """DataPipeline 테스트"""
+
+    async def test_streaming_execute_end_to_end(self, openai_client, index):
+        """정제부터 업서트까지 스트리밍 실행"""
+        pipeline = make_pipeline(openai_client, index)
+        crawl_result = make_crawl_result([
+            "청년  전용 대환대출 &amp; 저금리",
+            "청년 월세 지원",
+            "   ",
+        ])
+
+        context = await pipeline.execute(crawl_result)
+
+        assert context.errors == []
+        assert context.metadata["cleaning_stats"] == {
+            "original_count": 3, "cleaned_count": 2
+        }
+        assert sorted(context.embeddings) == ["policy-0", "policy-1"]
+        assert index.upserted_ids == ["policy-0", "policy-1"]
+
+        upserted = {v["id"]: v for batch in index.batches for v in batch}
+        assert upserted["policy-0"]["metadata"]["source_tier"] == "Tier 1"
+        assert isinstance(upserted["policy-0"]["values"], list)
+        assert sorted(openai_client.embeddings.calls[0]) == [
+            "청년 월세 지원", "청년 전용 대환대출 & 저금리"
+        ]
+
+    async def test_mixed_pipeline_streams(self, openai_client, index):
+        """process만 구현한 단계가 섞여 있어도 끝까지 실행"""
+        pipeline = make_pipeline(
+            openai_client, index, extra_steps=[ExcludeFilterStep()]
+        )
+        crawl_result = make_crawl_result(["청년 월세 지원", "제외 대상 정책"])
+
+        context = await pipeline.execute(crawl_result)
+
+        assert context.errors == []
+        assert openai_client.embeddings.calls == [["청년 월세 지원"]]
+        assert index.upserted_ids == ["policy-0"]
+
+    async def test_failed_upsert_not_counted(self, openai_client):
+        """업서트에 실패한 배치는 삽입 수에서 제외하고 오류로 기록"""
+        index = FailingIndex(fail_size=2)
+        pipeline = make_pipeline(openai_client, index)
+        pipeline._steps[-1]._stream_flush_size = 2
+
+        context = await pipeline.execute(
+            make_crawl_result(["청년 월세 지원", "청년 전용 대환대출", "청년 도약계좌"])
+        )
+
+        assert context.metadata["insertion_stats"]["inserted_count"] == 1
+        assert context.errors == ["Vector DB 삽입 실패: 업서트 실패"]
+
+    async def test_second_run_hits_cache(self, openai_client, index, cache):
+        """두 번째 실행은 캐시에서 임베딩을 제공"""
+        pipeline = make_pipeline(openai_client, index, cache)
+        contents = ["청년 전용 대환대출", "청년 월세 지원"]
+
+        await pipeline.execute(make_crawl_result(contents))
+        context = await pipeline.execute(make_crawl_result(contents))
+
+        assert len(openai_client.embeddings.calls) == 1
+        assert context.metadata["embedding_stats"]["cache_hits"] == 2
+        assert context.metadata["embedding_stats"]["cache_misses"] == 0
+        assert sorted(context.embeddings) == ["policy-0", "policy-1"]
+
+    async def test_changed_figures_are_re_embedded(self, openai_client, index, cache):
+        """금액만 바뀐 정책은 지문이 가까워도 다시 임베딩 (근사 조회는 기본 꺼짐)"""
+        pipeline = make_pipeline(openai_client, index, cache)
+        template = (
+            "청년 월세 한시 특별지원 사업은 부모와 따로 거주하는 무주택 청년을 "
+            "대상으로 합니다. 청년가구 소득이 기준 중위소득 60% 이하인 경우 "
+            "신청할 수 있습니다. 지원 금액은 월 최대 {}만원입니다."
+        )
+        # 두 텍스트의 SimHash 해밍 거리는 2
+        before, after = template.format(20), template.format(30)
+
+        await pipeline.execute(make_crawl_result([before]))
+        context = await pipeline.execute(make_crawl_result([after]))
+
+        assert openai_client.embeddings.calls == [[before], [after]]
+        assert context.metadata["embedding_stats"]["fuzzy_hits"] == 0
+        assert context.metadata["embedding_stats"]["cache_misses"] == 1
+
+    async def test_close_closes_cache(self, openai_client, index):
+        """파이프라인 종료 시 임베딩 캐시도 닫힘"""
+        cache = SQLiteEmbeddingCache(":memory:")
+        pipeline = make_pipeline(openai_client, index, cache)
+
+        async with pipeline:
+            await pipeline.execute(make_crawl_result(["청년 월세 지원"]))
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            cache.get_many(["00" * 16])
+
+    async def test_create_default_uses_sqlite_cache(self, tmp_path):
+        """기본 파이프라인은 튜닝된 SQLite 임베딩 캐시를 사용"""
+        cache_path = tmp_path / "embedding_cache.db"
+        pipeline = DataPipeline.create_default(
+            "openai", "pinecone", "index", cache_path=str(cache_path)
+        )
+
+        cache = pipeline._steps[1]._cache
+        assert isinstance(cache, SQLiteEmbeddingCache)
+        assert cache._conn.execute("PRAGMA page_size").fetchone()[0] == 8192
+        assert cache._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert cache._conn.execute("PRAGMA user_version").fetchone()[0] == 1
+
+        await pipeline.close()
+        assert cache_path.exists()
+
+        no_cache = DataPipeline.create_default(
+            "openai", "pinecone", "index", cache_path=None
+        )
+        assert no_cache._steps[1]._cache is None
+
+    async def test_duplicate_content_embedded_once(self, openai_client, index):
+        """같은 콘텐츠는 한 번만 임베딩하고 모든 정책에 할당"""
+        pipeline = make_pipeline(openai_client, index)
+        crawl_result = make_crawl_result(["청년 월세 지원"] * 3)
+
+        context = await pipeline.execute(crawl_result)
+
+        assert openai_client.embeddings.calls == [["청년 월세 지원"]]
+        assert sorted(context.embeddings) == ["policy-0", "policy-1", "policy-2"]
+        assert index.upserted_ids == ["policy-0", "policy-1", "policy-2"]
+
+    async def test_empty_input_returns_early(self, openai_client, index):
+        """빈 크롤링 결과는 어떤 단계도 실행하지 않음"""
+        pipeline = make_pipeline(openai_client, index)
+
+        context = await pipeline.execute(make_crawl_result([]))
+
+        assert context.processed_policies == []
+        assert context.errors == []
+        assert openai_client.embeddings.calls == []
+        assert index.batches == []
+
+
+# =============================================================================
+# 단계별 테스트
+# =============================================================================
+
+class TestEmbeddingGenerationStep:
+    """EmbeddingGenerationStep 테스트"""
+
+    async def test_batches_split_by_token_budget(self, openai_client, monkeypatch):
+        """토큰 예산을 넘으면 배치를 나눔"""
+        monkeypatch.setattr(pipeline_module, "_MAX_BATCH_TOKENS", 10)
+        step = EmbeddingGenerationStep("test-key")
+        step._count_tokens = len
+
+        policies = [
+            {"id": "a", "content": "가" * 6},
+            {"id": "b", "content": "나" * 5},
+            {"id": "c", "content": "다" * 4},
+        ]
+        embeddings = await step._embed_policies(openai_client, policies)
+
+        # 길이 순 정렬 후 6 / 5+4 로 분할
+        assert openai_client.embeddings.calls == [["가" * 6], ["나" * 5, "다" * 4]]
+        assert sorted(embeddings) == ["a", "b", "c"]
+
+
+class TestVectorDBInsertionStep:
+    """VectorDBInsertionStep 테스트"""
+
+    def test_parallel_upsert_chunks_async_requests(self, index):
+        """batch_size 단위로 요청하고 chunk_size 단위로 응답을 기다림"""
+        step = VectorDBInsertionStep(
+            "test-key", "test-index", batch_size=2, chunk_size=4
+        )
+        vectors = [
+            {"id": str(i), "values": pipeline_module.np.zeros(3), "metadata": {}}
+            for i in range(5)
+        ]
+
+        step._parallel_upsert(index, vectors)
+
+        assert [len(batch) for batch in index.batches] == [2, 2, 1]
+        assert index.max_outstanding == 4
+        assert index.outstanding == 0